@@ -0,0 +1 @@
+"""Заміри продуктивності шару даних без графічного інтерфейсу."""
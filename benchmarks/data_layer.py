@@ -0,0 +1,353 @@
+"""Навантажувальні заміри шару даних без Qt: запис, читання та оновлення на синтетичній історії.
+
+Запуск: python -m benchmarks.data_layer [--sizes 1000,100000,1000000] [--users N] [--output results.json]
+Порівняння з попереднім прогоном: python -m benchmarks.data_layer --compare old.json
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, time as clock_time, timedelta
+from itertools import islice
+
+from sqlalchemy import func, insert, select
+
+from models.base import BloodPressure, CalendarEvent, PregnancyData, Reminder, UserProfile, WishlistItem
+from models.database import Database, dispose_engines
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_SIZES = '1000,100000'
+SEED_CHUNK = 50000
+HISTORY_DAYS = 3 * 365
+BATCH_SIZE = 100
+
+# Частка кожної таблиці в загальній кількості рядків синтетичної історії
+TABLE_SHARES = {
+    'blood_pressure': 0.40,
+    'baby_kicks': 0.20,
+    'weight_records': 0.10,
+    'contractions': 0.10,
+    'belly_measurements': 0.05,
+    'health_notes': 0.05,
+    'calendar_events': 0.05,
+    'reminders': 0.03,
+    'wishlist': 0.02,
+}
+
+
+def peak_rss_mb():
+    """Пікове використання пам'яті процесом у МБ (None, якщо недоступно); кожен розмір міряється в окремому процесі"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux повертає кілобайти, macOS — байти
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _day(rng):
+    return (date.today() - timedelta(days=rng.randrange(HISTORY_DAYS))).strftime('%Y-%m-%d')
+
+
+def _clock(rng, seconds=False):
+    value = f'{rng.randrange(24):02d}:{rng.randrange(60):02d}'
+    return f'{value}:{rng.randrange(60):02d}' if seconds else value
+
+
+def _weight(rng):
+    return _day(rng), round(rng.uniform(50, 95), 1)
+
+
+def _kick(rng):
+    return _day(rng), _clock(rng), rng.randint(1, 15)
+
+
+def _contraction(rng):
+    start = rng.randrange(23 * 3600)
+    duration = rng.randint(20, 90)
+    end = start + duration
+    return (_day(rng), f'{start // 3600:02d}:{start % 3600 // 60:02d}:{start % 60:02d}',
+            f'{end // 3600:02d}:{end % 3600 // 60:02d}:{end % 60:02d}', duration, rng.randint(1, 10))
+
+
+def _blood_pressure(rng):
+    return _day(rng), _clock(rng), rng.randint(95, 150), rng.randint(55, 95), rng.randint(55, 110), ''
+
+
+def _belly(rng):
+    return _day(rng), round(rng.uniform(70, 120), 1), ''
+
+
+def _note(rng):
+    return _day(rng), 'Самопочуття добре, трохи набрякають ноги', 'Нотатка'
+
+
+def _event_row(rng):
+    day = date.today() - timedelta(days=rng.randrange(HISTORY_DAYS))
+    return {'title': 'Візит до лікаря', 'description': '', 'start_date': day, 'end_date': day,
+            'all_day': True, 'event_type': 'regular'}
+
+
+def _reminder_row(rng):
+    return {'title': 'Вітаміни', 'description': '', 'reminder_type': 'custom',
+            'reminder_date': date.today() + timedelta(days=rng.randrange(30)),
+            'reminder_time': clock_time(rng.randrange(24), rng.randrange(60))}
+
+
+def _wishlist_row(rng):
+    return {'title': 'Коляска', 'description': '', 'category': 'Прогулянка',
+            'price': round(rng.uniform(100, 20000), 2), 'priority': rng.randint(1, 3)}
+
+
+# Генератори синтетичних рядків для пакетних методів Database та для прямої Core-вставки
+BULK_ROWS = {
+    'blood_pressure': ('add_blood_pressure_many', _blood_pressure),
+    'baby_kicks': ('add_baby_kick_many', _kick),
+    'weight_records': ('add_weight_record_many', _weight),
+    'contractions': ('add_contraction_many', _contraction),
+    'belly_measurements': ('add_belly_measurement_many', _belly),
+    'health_notes': ('add_health_note_many', _note),
+}
+CORE_ROWS = {
+    'calendar_events': (CalendarEvent, _event_row),
+    'reminders': (Reminder, _reminder_row),
+    'wishlist': (WishlistItem, _wishlist_row),
+}
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def seed(db, rows, users, rng):
+    """Заповнює базу приблизно rows рядками трирічної історії, розподіленими між users користувачами"""
+    db.session.execute(insert(UserProfile), [
+        {'id': user_id, 'email': f'user{user_id}@example.com', 'password_hash': '-'}
+        for user_id in range(1, users + 1)
+    ])
+    db.session.execute(insert(PregnancyData), [
+        {'user_id': user_id, 'last_period_date': date.today() - timedelta(days=rng.randrange(280))}
+        for user_id in range(1, users + 1)
+    ])
+    db.session.commit()
+
+    for table, share in TABLE_SHARES.items():
+        per_user = max(1, int(rows * share) // users)
+        for user_id in range(1, users + 1):
+            make_row = (BULK_ROWS.get(table) or CORE_ROWS[table])[1]
+            for chunk in _chunks((make_row(rng) for _ in range(per_user)), SEED_CHUNK):
+                if table in BULK_ROWS:
+                    getattr(db, BULK_ROWS[table][0])(chunk, user_id=user_id)
+                else:
+                    db._add_records(CORE_ROWS[table][0], chunk, user_id=user_id)
+
+
+def _sample_ids(db, model_class, limit=1000):
+    """Випадкові (id, user_id) наявних записів для замірів оновлення"""
+    stmt = select(model_class.id, model_class.user_id).order_by(func.random()).limit(limit)
+    return [tuple(row) for row in db.session.execute(stmt)]
+
+
+def build_cases(db, rng, users):
+    """Список (назва, функція): кожна функція виконує одну операцію шару даних"""
+    user = lambda: rng.randint(1, users)  # noqa: E731
+    batch = lambda make_row: [make_row(rng) for _ in range(BATCH_SIZE)]  # noqa: E731
+    wishlist_ids = _sample_ids(db, WishlistItem)
+    reminder_ids = _sample_ids(db, Reminder)
+    pressure_ids = _sample_ids(db, BloodPressure)
+    pick = lambda ids: rng.choice(ids) if ids else (0, 1)  # noqa: E731
+
+    def update_wishlist():
+        item_id, user_id = pick(wishlist_ids)
+        return db.update_wishlist_item(item_id, 'Ліжечко', '', 'Сон', 3500.0, 1, rng.random() < 0.5,
+                                       user_id=user_id)
+
+    def update_pressure():
+        item_id, user_id = pick(pressure_ids)
+        return db._update_item(BloodPressure, item_id, user_id=user_id, systolic=rng.randint(95, 150))
+
+    return [
+        ('add_weight_record', lambda: db.add_weight_record(*_weight(rng), user_id=user())),
+        ('add_baby_kick', lambda: db.add_baby_kick(*_kick(rng), user_id=user())),
+        ('add_contraction', lambda: db.add_contraction(*_contraction(rng), user_id=user())),
+        ('add_blood_pressure', lambda: db.add_blood_pressure(*_blood_pressure(rng), user_id=user())),
+        ('add_belly_measurement', lambda: db.add_belly_measurement(*_belly(rng), user_id=user())),
+        ('add_health_note', lambda: db.add_health_note(*_note(rng), user_id=user())),
+        ('add_wishlist_item', lambda: db.add_wishlist_item('Пляшечки', '', 'Годування', 450.0, user_id=user())),
+        ('add_reminder', lambda: db.add_reminder('Вітаміни', '', _day(rng), _clock(rng), user_id=user())),
+        ('add_calendar_event', lambda: db.add_calendar_event('УЗД', '', _day(rng), _clock(rng), user_id=user())),
+        (f'add_weight_record_many[{BATCH_SIZE}]', lambda: db.add_weight_record_many(batch(_weight), user_id=user())),
+        (f'add_baby_kick_many[{BATCH_SIZE}]', lambda: db.add_baby_kick_many(batch(_kick), user_id=user())),
+        (f'add_contraction_many[{BATCH_SIZE}]',
+         lambda: db.add_contraction_many(batch(_contraction), user_id=user())),
+        (f'add_blood_pressure_many[{BATCH_SIZE}]',
+         lambda: db.add_blood_pressure_many(batch(_blood_pressure), user_id=user())),
+        (f'add_belly_measurement_many[{BATCH_SIZE}]',
+         lambda: db.add_belly_measurement_many(batch(_belly), user_id=user())),
+        (f'add_health_note_many[{BATCH_SIZE}]', lambda: db.add_health_note_many(batch(_note), user_id=user())),
+        ('get_user_profile', lambda: db.get_user_profile(user())),
+        ('get_pregnancy_data', lambda: db.get_pregnancy_data(user())),
+        ('get_weight_records', lambda: db.get_weight_records(user_id=user())),
+        ('get_weight_records_page', lambda: db.get_weight_records_page(user_id=user())),
+        ('get_baby_kicks', lambda: db.get_baby_kicks(user_id=user())),
+        ('get_contractions', lambda: db.get_contractions(user_id=user(), days=7)),
+        ('get_blood_pressure', lambda: db.get_blood_pressure(user_id=user())),
+        ('get_blood_pressure_page', lambda: db.get_blood_pressure_page(user_id=user())),
+        ('get_belly_measurements', lambda: db.get_belly_measurements(user_id=user())),
+        ('get_belly_measurements_page', lambda: db.get_belly_measurements_page(user_id=user())),
+        ('get_health_notes', lambda: db.get_health_notes(user_id=user())),
+        ('get_health_notes_page', lambda: db.get_health_notes_page(user_id=user())),
+        ('get_metric_stats', lambda: db.get_metric_stats('systolic', 'week', user_id=user())),
+        ('get_contraction_interval_stats', lambda: db.get_contraction_interval_stats(user_id=user())),
+        ('get_wishlist_items', lambda: db.get_wishlist_items(user_id=user())),
+        ('get_active_reminders', lambda: db.get_active_reminders(user_id=user())),
+        ('get_events_for_date', lambda: db.get_events_for_date(_day(rng), user_id=user())),
+        ('_update_item', update_pressure),
+        ('mark_wishlist_item_purchased', lambda: db.mark_wishlist_item_purchased(*pick(wishlist_ids))),
+        ('update_wishlist_item', update_wishlist),
+        ('complete_reminder', lambda: db.complete_reminder(*pick(reminder_ids))),
+    ]
+
+
+def _percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def measure(operation, ops, max_seconds):
+    """Виконує операцію до ops разів (або поки не вичерпано max_seconds) і рахує пропускну здатність"""
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(ops):
+        op_started = time.perf_counter_ns()
+        operation()
+        latencies.append(time.perf_counter_ns() - op_started)
+        if time.perf_counter() - started > max_seconds:
+            break
+    total = sum(latencies) / 1e9
+    latencies.sort()
+    return {
+        'ops': len(latencies),
+        'ops_per_sec': len(latencies) / total if total else None,
+        'p50_ms': _percentile(latencies, 0.50) / 1e6,
+        'p99_ms': _percentile(latencies, 0.99) / 1e6,
+    }
+
+
+def run_size(rows, args, workdir):
+    db_path = os.path.join(workdir, f'bench_{rows}.db')
+    db = Database(db_path, profile=args.profile)
+    rng = random.Random(args.seed)
+
+    started = time.perf_counter()
+    seed(db, rows, args.users, rng)
+    seed_seconds = time.perf_counter() - started
+    print(f"{rows} рядків: заповнено за {seed_seconds:.1f} с", file=sys.stderr)
+
+    results = []
+    for name, operation in build_cases(db, rng, args.users):
+        if args.only and not any(part in name for part in args.only.split(',')):
+            continue
+        result = {'size': rows, 'case': name, **measure(operation, args.ops, args.max_seconds)}
+        results.append(result)
+        print(f"  {name:<36} {result['ops_per_sec']:>10.0f} оп/с  p50 {result['p50_ms']:>8.3f} мс  "
+              f"p99 {result['p99_ms']:>8.3f} мс", file=sys.stderr)
+
+    db.close()
+    dispose_engines()
+    return {'size': rows, 'seed_seconds': seed_seconds, 'db_bytes': os.path.getsize(db_path),
+            'peak_rss_mb': peak_rss_mb(), 'cases': results}
+
+
+def run_size_isolated(rows, args, workdir):
+    """run_size у новому процесі: ru_maxrss — пік усього процесу, тож інакше кожен розмір успадкував би пік попередніх"""
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as pool:
+        return pool.submit(run_size, rows, args, workdir).result()
+
+
+def compare(current, baseline, threshold):
+    """Друкує зміну оп/с відносно попереднього прогону; повертає кількість регресій понад threshold"""
+    previous = {(r['size'], r['case']): r for run in baseline['runs'] for r in run['cases']}
+    regressions = 0
+    print(f"{'size':>8} {'case':<36} {'було оп/с':>12} {'стало оп/с':>12} {'зміна':>8}")
+    for run in current['runs']:
+        for r in run['cases']:
+            old = previous.get((r['size'], r['case']))
+            if not old or not old['ops_per_sec'] or not r['ops_per_sec']:
+                continue
+            change = r['ops_per_sec'] / old['ops_per_sec'] - 1
+            marker = ''
+            if change < -threshold:
+                regressions += 1
+                marker = '  РЕГРЕСІЯ'
+            print(f"{r['size']:>8} {r['case']:<36} {old['ops_per_sec']:>12.0f} {r['ops_per_sec']:>12.0f} "
+                  f"{change:>+8.1%}{marker}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Заміри шару даних на синтетичній історії')
+    parser.add_argument('--sizes', default=DEFAULT_SIZES, help='розміри історії через кому, напр. 1000,100000,1000000')
+    parser.add_argument('--users', type=int, default=20, help='кількість користувачів у синтетичній базі')
+    parser.add_argument('--ops', type=int, default=200, help='максимум операцій на кожен замір')
+    parser.add_argument('--max-seconds', type=float, default=5.0, help='ліміт часу на кожен замір')
+    parser.add_argument('--only', help='лише заміри, назви яких містять ці підрядки (через кому)')
+    parser.add_argument('--profile', help='профіль зберігання SQLite')
+    parser.add_argument('--seed', type=int, default=42, help='зерно генератора синтетичних даних')
+    parser.add_argument('--output', help='файл для результатів у JSON (за замовчуванням stdout)')
+    parser.add_argument('--compare', help='JSON попереднього прогону для порівняння')
+    parser.add_argument('--threshold', type=float, default=0.2, help='падіння оп/с, яке вважається регресією')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        runs = [run_size_isolated(int(size), args, workdir) for size in args.sizes.split(',')]
+
+    report = {
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'sqlite': sqlite3.sqlite_version,
+        'platform': platform.platform(),
+        'params': {'users': args.users, 'ops': args.ops, 'max_seconds': args.max_seconds,
+                   'profile': args.profile, 'seed': args.seed},
+        'runs': runs,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    else:
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        return 1 if compare(report, baseline, args.threshold) else 0
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
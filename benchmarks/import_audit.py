@@ -0,0 +1,94 @@
+"""Аудит імпортів під час запуску (на основі python -X importtime).
+
+Імпортує main в окремому процесі (з вимкненим трасуванням запуску), підсумовує власний час імпорту кожного модуля й пакета
+та завершується з кодом 1, якщо сумарний час перевищує бюджет або під час запуску
+завантажився модуль, який має імпортуватися лише за потреби (reportlab, numpy, cv2).
+
+Запуск: python -m benchmarks.import_audit [--budget-ms 1500] [--forbid reportlab,numpy,cv2] [--output audit.json]
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from collections import Counter
+
+from utils.startup_trace import TRACE_OFF_ENV
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BUDGET_MS = 1500.0
+# Важкі залежності, які підключаються через utils.lazy_import при першому використанні
+DEFAULT_FORBIDDEN = 'reportlab,numpy,cv2'
+
+_IMPORTTIME_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+
+def run_importtime(module):
+    """Рядки (модуль, власний час мкс, сукупний час мкс, глибина) для import <module> в окремому процесі"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT_DIR, capture_output=True, text=True,
+        # Хук трасування в sys.meta_path додавав би свій час до кожного імпорту
+        env={**os.environ, TRACE_OFF_ENV: '1'},
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Не вдалося імпортувати {module}:\n{result.stderr[-2000:]}")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            rows.append((match[4], int(match[1]), int(match[2]), len(match[3]) // 2))
+    return rows
+
+
+def audit(rows, budget_ms, forbidden, top):
+    by_package = Counter()
+    for name, self_us, _, _ in rows:
+        by_package[name.split('.')[0]] += self_us
+    total_ms = sum(by_package.values()) / 1000
+    imported = {name for name, _, _, _ in rows}
+    forbidden_found = sorted(f for f in forbidden if f in imported or any(n.startswith(f + '.') for n in imported))
+
+    return {
+        'total_ms': round(total_ms, 1),
+        'budget_ms': budget_ms,
+        'modules': len(rows),
+        'forbidden': forbidden_found,
+        'packages': [{'package': p, 'self_ms': round(us / 1000, 1)} for p, us in by_package.most_common(top)],
+        'slowest_modules': [{'module': name, 'self_ms': round(self_us / 1000, 1), 'cumulative_ms': round(cum_us / 1000, 1)}
+                            for name, self_us, cum_us, _ in sorted(rows, key=lambda r: r[1], reverse=True)[:top]],
+        'ok': total_ms <= budget_ms and not forbidden_found,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Аудит часу імпортів під час запуску додатку')
+    parser.add_argument('--module', default='main', help='модуль, імпорт якого заміряється')
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS, help='бюджет сумарного часу імпортів')
+    parser.add_argument('--forbid', default=DEFAULT_FORBIDDEN, help='пакети, які не можна імпортувати при запуску (через кому)')
+    parser.add_argument('--top', type=int, default=15, help='скільки найдорожчих пакетів і модулів показати')
+    parser.add_argument('--output', help='файл для результатів у JSON')
+    args = parser.parse_args()
+
+    forbidden = [f.strip() for f in args.forbid.split(',') if f.strip()]
+    report = audit(run_importtime(args.module), args.budget_ms, forbidden, args.top)
+
+    print(f"Імпорт {args.module}: {report['total_ms']:.0f} мс ({report['modules']} модулів), "
+          f"бюджет {args.budget_ms:.0f} мс")
+    for row in report['packages']:
+        print(f"  {row['package']:<32} {row['self_ms']:>8.1f} мс")
+    if report['forbidden']:
+        print(f"Під час запуску імпортовано: {', '.join(report['forbidden'])}")
+    if report['total_ms'] > args.budget_ms:
+        print(f"Перевищено бюджет імпортів на {report['total_ms'] - args.budget_ms:.0f} мс")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    return 0 if report['ok'] else 1
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
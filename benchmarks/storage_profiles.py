@@ -0,0 +1,61 @@
+"""Порівняння профілів зберігання SQLite на вставці та читанні.
+
+Запуск: python -m benchmarks.storage_profiles [--rows N]
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import date, timedelta
+
+from models.database import Database, STORAGE_PROFILES, dispose_engines
+
+
+def _bp_rows(count):
+    start = date(2024, 1, 1)
+    for i in range(count):
+        day = start + timedelta(days=i // 24)
+        yield day.strftime('%Y-%m-%d'), f'{i % 24:02d}:00', 110 + i % 30, 70 + i % 20, 60 + i % 40, ''
+
+
+def _timed(func, *args, **kwargs):
+    started = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - started
+
+
+def run_profile(profile, rows, single_rows, workdir):
+    db_path = os.path.join(workdir, f'{profile}.db')
+    db = Database(db_path, profile=profile)
+
+    single = _timed(lambda: [db.add_blood_pressure(*row) for row in _bp_rows(single_rows)])
+    bulk = _timed(db.add_blood_pressure_many, _bp_rows(rows))
+    scan = _timed(db.get_blood_pressure, days=None)
+
+    db.close()
+    return {
+        'profile': profile,
+        'single_insert_rows_per_sec': single_rows / single,
+        'bulk_insert_rows_per_sec': rows / bulk,
+        'scan_rows_per_sec': (rows + single_rows) / scan,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=50000, help='кількість рядків для пакетної вставки')
+    parser.add_argument('--single-rows', type=int, default=500, help='кількість вставок з окремим commit')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        results = [run_profile(name, args.rows, args.single_rows, workdir) for name in STORAGE_PROFILES]
+        dispose_engines()
+
+    print(f"{'profile':<10} {'single ins/s':>14} {'bulk ins/s':>14} {'scan rows/s':>14}")
+    for r in results:
+        print(f"{r['profile']:<10} {r['single_insert_rows_per_sec']:>14.0f} "
+              f"{r['bulk_insert_rows_per_sec']:>14.0f} {r['scan_rows_per_sec']:>14.0f}")
+
+
+if __name__ == '__main__':
+    main()
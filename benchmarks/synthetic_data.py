@@ -0,0 +1,307 @@
+"""Генератор реалістичних синтетичних баз щоденника вагітності для навантажувального тестування.
+
+Кожен користувач отримує профіль, перебіг вагітності та щільні ряди трекерів: тиск щогодини, вага щодня,
+сесії поштовхів з 18 тижня, перейми в день пологів, заміри живота, нотатки, події календаря та нагадування.
+Дані генеруються потоково та вставляються пакетами, тож пам'ять не залежить від кількості рядків;
+однакове зерно дає однакову базу.
+
+Запуск: python -m benchmarks.synthetic_data --db load_test.db [--users N] [--seed S] [--years Y]
+Наявну базу зі справжніми (не синтетичними) користувачами генератор змінює лише з --force.
+"""
+import argparse
+import math
+import os
+import random
+import sqlite3
+import sys
+import time
+from collections import namedtuple
+from datetime import date, datetime, time as clock_time, timedelta
+from functools import lru_cache
+from itertools import islice
+
+from sqlalchemy import Date, DateTime, Time, func, insert, select
+from sqlalchemy.dialects import sqlite
+
+from models import rollups
+from models.base import UserProfile, PregnancyData, WeightRecord, CalendarEvent, HealthNote, BabyKick, \
+    Contraction, BloodPressure, BellyMeasurement, Reminder
+from models.database import Database
+
+CHUNK_SIZE = 20000
+SYNTHETIC_EMAIL_SUFFIX = '@example.com'
+PREGNANCY_DAYS = 280
+
+# Перебіг вагітності користувача: дата останньої менструації, останній день записів і день пологів (якщо були)
+Pregnancy = namedtuple('Pregnancy', ['last_period_date', 'end', 'labour_day', 'weight_before'])
+
+HEALTH_NOTES = [
+    ('Самопочуття', 'Трохи нудило зранку, після сніданку минуло'),
+    ('Набряки', 'Ввечері набрякли ноги, відпочивала з піднятими ногами'),
+    ('Сон', 'Погано спала, часто прокидалась'),
+    ('Активність', 'Гуляла годину в парку, почуваюсь добре'),
+    ('Харчування', 'Хотілося солоного, пила багато води'),
+]
+
+# Добовий ритм тиску та пульсу: мінімум уночі, максимум удень
+CIRCADIAN = [5 * math.sin((hour - 8) / 24 * 2 * math.pi) for hour in range(24)]
+
+_DIALECT = sqlite.dialect()
+
+
+def _processor(column_type):
+    return column_type.dialect_impl(_DIALECT).bind_processor(_DIALECT)
+
+
+# Рядки готуються вже у форматі зберігання SQLite тими ж процесорами типів, що й у SQLAlchemy:
+# так вставка минає покрокову обробку параметрів і йде одним executemany
+_format_date = lru_cache(maxsize=None)(_processor(Date()))
+_format_time = _processor(Time())
+_format_datetime = _processor(DateTime())
+
+
+@lru_cache(maxsize=None)
+def _clock(hour, minute, second=0):
+    return _format_time(clock_time(hour, minute, second))
+
+
+def _weeks(pregnancy, day):
+    return (day - pregnancy.last_period_date).days / 7
+
+
+def _days(pregnancy):
+    day = pregnancy.last_period_date
+    while day <= pregnancy.end:
+        yield day, _format_date(day)
+        day += timedelta(days=1)
+
+
+def make_pregnancy(rng, today, history_days):
+    """Вагітність, що почалася в межах останніх history_days днів; завершені закінчуються пологами"""
+    last_period_date = today - timedelta(days=rng.randrange(history_days))
+    due = last_period_date + timedelta(days=PREGNANCY_DAYS + rng.randint(-14, 12))
+    labour_day = due if due <= today else None
+    return Pregnancy(last_period_date, min(due, today), labour_day, round(rng.uniform(48, 85), 1))
+
+
+def blood_pressure_rows(rng, pregnancy):
+    """Тиск щогодини: добовий ритм, легке зростання в третьому триместрі та шум вимірювань"""
+    gauss, randrange = rng.gauss, rng.randrange
+    base_systolic = gauss(112, 7)
+    base_diastolic = gauss(72, 5)
+    for day, day_text in _days(pregnancy):
+        weeks = _weeks(pregnancy, day)
+        trend = max(0.0, weeks - 26) * 0.6
+        for hour, circadian in enumerate(CIRCADIAN):
+            yield (day_text, _clock(hour, randrange(60)),
+                   round(base_systolic + trend + circadian + gauss(0, 5)),
+                   round(base_diastolic + (trend + circadian) * 0.6 + gauss(0, 4)),
+                   round(78 + weeks * 0.3 + circadian + gauss(0, 6)), '')
+
+
+def weight_rows(rng, pregnancy):
+    """Вага щодня: близько 1,5 кг за перший триместр, далі приблизно 0,45 кг на тиждень"""
+    for day, day_text in _days(pregnancy):
+        weeks = _weeks(pregnancy, day)
+        gain = weeks * 0.11 if weeks < 13 else 1.5 + (weeks - 13) * 0.45
+        yield day_text, round(pregnancy.weight_before + gain + rng.gauss(0, 0.3), 1)
+
+
+def kick_rows(rng, pregnancy):
+    """Сесії підрахунку поштовхів з 18 тижня: 1-3 на день, по кілька записів з інтервалом у хвилини"""
+    randint = rng.randint
+    for day, day_text in _days(pregnancy):
+        if _weeks(pregnancy, day) < 18:
+            continue
+        for _ in range(randint(1, 3)):
+            minute = rng.randrange(8 * 60, 22 * 60)
+            for _ in range(randint(3, 10)):
+                yield day_text, _clock(minute // 60, minute % 60), randint(1, 3)
+                minute = min(minute + randint(1, 6), 24 * 60 - 1)
+
+
+def _contraction(started, duration, intensity):
+    ended = started + timedelta(seconds=duration)
+    return (_format_date(started.date()), _clock(started.hour, started.minute, started.second),
+            _clock(ended.hour, ended.minute, ended.second), duration, intensity)
+
+
+def contraction_rows(rng, pregnancy):
+    """Поодинокі тренувальні перейми з 28 тижня та серія переймів у день пологів"""
+    for day, _ in _days(pregnancy):
+        if _weeks(pregnancy, day) >= 28 and rng.random() < 0.08:
+            started = datetime.combine(day, clock_time(rng.randrange(24), rng.randrange(60)))
+            for _ in range(rng.randint(1, 4)):
+                yield _contraction(started, rng.randint(20, 40), rng.randint(1, 3))
+                started += timedelta(minutes=rng.randint(10, 40))
+
+    if pregnancy.labour_day:
+        # Інтервали скорочуються з ~20 до ~3 хвилин, перейми стають довшими та сильнішими
+        started = datetime.combine(pregnancy.labour_day, clock_time(rng.randrange(24), rng.randrange(60)))
+        total = rng.randint(40, 90)
+        for i in range(total):
+            progress = i / total
+            yield _contraction(started, round(30 + 45 * progress + rng.gauss(0, 5)),
+                               min(10, max(1, round(2 + 8 * progress + rng.gauss(0, 1)))))
+            started += timedelta(seconds=round((20 - 17 * progress) * 60 + rng.gauss(0, 45)))
+
+
+def belly_rows(rng, pregnancy):
+    """Обхват живота раз на тиждень з 12 тижня"""
+    base = rng.gauss(78, 4)
+    for day, day_text in _days(pregnancy):
+        weeks = _weeks(pregnancy, day)
+        if weeks >= 12 and (day - pregnancy.last_period_date).days % 7 == 0:
+            yield day_text, round(base + (weeks - 12) * 0.9 + rng.gauss(0, 0.8), 1), ''
+
+
+def health_note_rows(rng, pregnancy):
+    for _, day_text in _days(pregnancy):
+        if rng.random() < 0.15:
+            yield (day_text, *rng.choice(HEALTH_NOTES))
+
+
+def calendar_event_rows(rng, pregnancy):
+    """Візити до лікаря: раз на 4 тижні, з 28 тижня раз на 2, з 36 щотижня; УЗД на 12, 20 та 32 тижні"""
+    week = 8
+    while week <= 41:
+        day = pregnancy.last_period_date + timedelta(weeks=week, days=rng.randint(0, 2))
+        if day > pregnancy.end:
+            break
+        hour, minute = rng.randint(8, 17), rng.choice((0, 15, 30, 45))
+        title = 'УЗД' if week in (12, 20, 32) else 'Візит до лікаря'
+        yield (title, f'{week} тиждень', _format_date(day), _format_date(day), _clock(hour, minute),
+               _clock(hour + (minute + 45) // 60, (minute + 45) % 60), 0, 0, 'medical')
+        week += 4 if week < 28 else 2 if week < 36 else 1
+
+
+def reminder_rows(rng, pregnancy, today, created_at):
+    """Щотижневі нагадування про вітаміни та аналізи; минулі вже виконані"""
+    day = pregnancy.last_period_date + timedelta(days=rng.randint(0, 6))
+    while day <= pregnancy.end + timedelta(days=7):
+        for title, reminder_type in (('Вітаміни', 'medication'), ('Аналізи', 'medical')):
+            yield (title, '', _format_date(day), _clock(rng.choice((8, 9, 20)), 0), 1, int(day < today),
+                   reminder_type, created_at)
+        day += timedelta(days=7)
+
+
+def _user_series(rng, pregnancy, today, created_at):
+    """(модель, колонки, рядки) для всіх трекерів користувача; колонки без user_id"""
+    return [
+        (BloodPressure, ('date', 'time', 'systolic', 'diastolic', 'pulse', 'notes'),
+         blood_pressure_rows(rng, pregnancy)),
+        (WeightRecord, ('date', 'weight'), weight_rows(rng, pregnancy)),
+        (BabyKick, ('date', 'time', 'count'), kick_rows(rng, pregnancy)),
+        (Contraction, ('date', 'start_time', 'end_time', 'duration', 'intensity'), contraction_rows(rng, pregnancy)),
+        (BellyMeasurement, ('date', 'measurement', 'notes'), belly_rows(rng, pregnancy)),
+        (HealthNote, ('date', 'title', 'content'), health_note_rows(rng, pregnancy)),
+        (CalendarEvent, ('title', 'description', 'start_date', 'end_date', 'start_time', 'end_time', 'all_day',
+                         'reminder', 'event_type'), calendar_event_rows(rng, pregnancy)),
+        (Reminder, ('title', 'description', 'reminder_date', 'reminder_time', 'is_active', 'is_completed',
+                    'reminder_type', 'created_at'), reminder_rows(rng, pregnancy, today, created_at)),
+    ]
+
+
+@lru_cache(maxsize=None)
+def _insert_sql(model_class, columns):
+    return str(insert(model_class.__table__).compile(dialect=_DIALECT, column_keys=['user_id', *columns]))
+
+
+def _insert_chunks(connection, model_class, columns, rows, user_id, chunk_size):
+    sql = _insert_sql(model_class, columns)
+    inserted = 0
+    while True:
+        chunk = [(user_id, *row) for row in islice(rows, chunk_size)]
+        if not chunk:
+            return inserted
+        connection.exec_driver_sql(sql, chunk)
+        inserted += len(chunk)
+
+
+def generate(db, users, seed=0, years=3, today=None, chunk_size=CHUNK_SIZE):
+    """Додає users нових користувачів з історією; повертає кількість вставлених рядків по таблицях"""
+    today = today or date.today()
+    history_days = max(1, int(years * 365))
+    created_at = _format_datetime(datetime.utcnow())
+    counts = {UserProfile.__tablename__: users, PregnancyData.__tablename__: users}
+
+    with db.engine.begin() as connection:
+        first_id = (connection.execute(select(func.max(UserProfile.id))).scalar() or 0) + 1
+        # Тригери денних підсумків сповільнюють масову вставку; підсумки перераховуємо одним запитом у кінці
+        rollups.drop_triggers(connection)
+        try:
+            for user_id in range(first_id, first_id + users):
+                # Окреме зерно для кожного користувача: його дані не залежать від кількості інших
+                rng = random.Random(f'{seed}:{user_id}')
+                pregnancy = make_pregnancy(rng, today, history_days)
+                connection.execute(insert(UserProfile), [{
+                    'id': user_id, 'email': f'synthetic{user_id}{SYNTHETIC_EMAIL_SUFFIX}', 'password_hash': '-',
+                    'name': f'Користувач {user_id}', 'birth_date': today - timedelta(days=rng.randint(20, 40) * 365),
+                    'height': rng.randint(152, 182), 'weight_before_pregnancy': pregnancy.weight_before,
+                    'cycle_length': rng.randint(25, 32), 'is_verified': True,
+                }])
+                connection.execute(insert(PregnancyData), [{
+                    'user_id': user_id, 'last_period_date': pregnancy.last_period_date,
+                    'baby_gender': rng.choice(('Хлопчик', 'Дівчинка', 'Невідомо')), 'baby_name': '',
+                }])
+                for model_class, columns, rows in _user_series(rng, pregnancy, today, created_at):
+                    table = model_class.__tablename__
+                    counts[table] = counts.get(table, 0) + _insert_chunks(connection, model_class, columns, rows,
+                                                                          user_id, chunk_size)
+        finally:
+            rollups.install_triggers(connection)
+        rollups.rebuild(connection)
+
+    return counts
+
+
+def real_user_count(db_path):
+    """Кількість не синтетичних користувачів у наявній базі (без створення рушія та зміни налаштувань файлу)"""
+    if not os.path.exists(db_path):
+        return 0
+    connection = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
+    try:
+        has_users = connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (UserProfile.__tablename__,)).fetchone()
+        if not has_users:
+            return 0
+        return connection.execute(
+            f"SELECT count(*) FROM {UserProfile.__tablename__} WHERE email IS NULL OR email NOT LIKE ?",
+            ('synthetic%' + SYNTHETIC_EMAIL_SUFFIX,)).fetchone()[0]
+    finally:
+        connection.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Генерація синтетичної бази щоденника вагітності')
+    parser.add_argument('--db', required=True, help='файл бази даних (нові користувачі додаються)')
+    parser.add_argument('--users', type=int, default=10, help='кількість користувачів')
+    parser.add_argument('--seed', type=int, default=0, help='зерно генератора')
+    parser.add_argument('--years', type=float, default=3, help='за скільки років розкидані початки вагітностей')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='рядків в одному пакеті вставки')
+    parser.add_argument('--profile', default='fast', help='профіль зберігання SQLite на час генерації')
+    parser.add_argument('--force', action='store_true', help='дописувати навіть у базу зі справжніми користувачами')
+    args = parser.parse_args()
+
+    try:
+        real_users = real_user_count(args.db)
+    except sqlite3.DatabaseError as e:
+        parser.error(f"{args.db} не схожий на базу щоденника: {e}")
+    if real_users and not args.force:
+        parser.error(f"{args.db} містить {real_users} справжніх користувачів; генератор перебудовує тригери "
+                     f"та підсумки і змінює режим журналу файлу. Вкажіть іншу базу або --force")
+
+    db = Database(args.db, profile=args.profile)
+    started = time.perf_counter()
+    counts = generate(db, args.users, seed=args.seed, years=args.years, chunk_size=args.chunk_size)
+    elapsed = time.perf_counter() - started
+    db.close()
+
+    total = sum(counts.values())
+    for table, count in sorted(counts.items()):
+        print(f"{table:<20} {count:>12}")
+    print(f"Разом {total} рядків за {elapsed:.1f} с ({total / elapsed:.0f} рядків/с)", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,74 +1,140 @@
-import json
-import os
+from collections import namedtuple
+from models.development_content import get_development_content
+from utils.logger import get_logger
+from utils.resource_index import get_resource_index
+
+logger = get_logger('baby_development')
+
+MISSING_INFO = "Інформація відсутня"
+UNKNOWN_SIZE = "невідомо"
+GENERAL_TIP = "На цьому тижні важливо слідкувати за своїм здоров'ям та відвідувати лікаря за розкладом."
+
+# Усе, що екран тижнів показує для тижня: дані фрукта (з вагою та зростом) і картки (заголовок, текст)
+WeekPayload = namedtuple('WeekPayload', ['week', 'gender', 'fruit_data', 'cards'])
 
 
 class BabyDevelopmentController:
-    def __init__(self, data_file='resources/data/baby_development.json'):
-        self.data_file = data_file
-        self.development_data = self._load_development_data()
-
-    def _load_development_data(self):
-        try:
-            if os.path.exists(self.data_file):
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-        except Exception as e:
-            print(f"Помилка при завантаженні даних про розвиток дитини: {e}")
-        return {"weeks": {}}
+    def __init__(self):
+        self.content = get_development_content()
 
     def get_week_data(self, week):
-        return self.development_data.get("weeks", {}).get(str(week))
-
-    def _get_week_info(self, week, field, default="Інформація відсутня"):
-        week_data = self.get_week_data(week)
-        return week_data.get(field, default) if week_data else default
+        return self.content.week(week)
 
     def get_fruit_comparison(self, week):
-        week_data = self.get_week_data(week)
+        week_data = self.content.week(week)
         if not week_data:
             return None
 
         fruit_data = {
-            "fruit": week_data["size"]["fruit"],
-            "description": week_data["size"]["description"]
+            "fruit": week_data.fruit,
+            "description": week_data.size_description
         }
 
-        if "image" in week_data:
-            fruit_data["image"] = week_data["image"]
-        else:
-            default_image = f"resources/images/fruits/{week}.png"
-            if os.path.exists(default_image):
-                fruit_data["image"] = default_image
+        image = get_resource_index().week_image(week, week_data.image)
+        if image:
+            fruit_data["image"] = image
 
         return fruit_data
 
     def get_baby_development_info(self, week, gender=None):
-        week_data = self.get_week_data(week)
+        week_data = self.content.week(week)
         if not week_data:
-            return "Інформація відсутня"
+            return MISSING_INFO
 
-        if gender in ["Хлопчик", "Дівчинка"]:
-            gender_key = "boy_development" if gender == "Хлопчик" else "girl_development"
-            gender_info = week_data.get(gender_key, "")
-            if gender_info:
-                return gender_info
+        if gender == "Хлопчик" and week_data.boy_development:
+            return week_data.boy_development
+        if gender == "Дівчинка" and week_data.girl_development:
+            return week_data.girl_development
 
-        return week_data.get("baby_development", "Інформація відсутня")
+        return week_data.baby_development if week_data.baby_development is not None else MISSING_INFO
 
     def get_mother_changes_info(self, week):
-        return self._get_week_info(week, "mother_changes")
+        week_data = self.content.week(week)
+        if not week_data or week_data.mother_changes is None:
+            return MISSING_INFO
+        return week_data.mother_changes
 
     def get_nutrition_tips(self, week):
-        return self._get_week_info(week, "nutrition_tips")
+        week_data = self.content.week(week)
+        if not week_data or week_data.nutrition_tips is None:
+            return MISSING_INFO
+        return week_data.nutrition_tips
 
     def get_baby_size(self, week):
-        week_data = self.get_week_data(week)
+        week_data = self.content.week(week)
         if week_data:
             return {
-                "weight": week_data.get("weight", "невідомо"),
-                "length": week_data.get("length", "невідомо")
+                "weight": week_data.weight if week_data.weight is not None else UNKNOWN_SIZE,
+                "length": week_data.length if week_data.length is not None else UNKNOWN_SIZE
             }
-        return {"weight": "невідомо", "length": "невідомо"}
+        return {"weight": UNKNOWN_SIZE, "length": UNKNOWN_SIZE}
+
+    def get_baby_size_values(self, week):
+        """Вага в грамах і зріст у міліметрах як (мін, макс); None, якщо даних немає"""
+        week_data = self.content.week(week)
+        if not week_data:
+            return None
+        return {
+            "weight_g": (week_data.weight_min_g, week_data.weight_max_g),
+            "length_mm": (week_data.length_min_mm, week_data.length_max_mm)
+        }
 
     def get_available_weeks(self):
-        return sorted([int(week) for week in self.development_data.get("weeks", {}).keys()])
\ No newline at end of file
+        return list(self.content.available_weeks)
+
+    def build_week_payload(self, week, gender=None):
+        fruit_data = self.get_fruit_comparison(week)
+        if fruit_data:
+            fruit_data.update(self.get_baby_size(week))
+        cards = (
+            ("Зростання вашої дитини", self.get_baby_development_info(week, gender)),
+            ("Все про вас", self.get_mother_changes_info(week)),
+            ("Поради щодо харчування", self.get_nutrition_tips(week)),
+            ("Поради для вашого терміну", GENERAL_TIP),
+        )
+        return WeekPayload(week, gender, fruit_data, cards)
+
+
+class WeekPayloadCache:
+    """Готові WeekPayload за ключем (тиждень, стать): для користувача це чиста функція цих двох значень"""
+
+    def __init__(self):
+        self.controller = BabyDevelopmentController()
+        self._payloads = {}
+        # callback(стать) після скидання: старі дані прибрано, тижні варто підготувати заново
+        self._invalidation_listeners = []
+
+    def get(self, week, gender=None):
+        key = (week, gender)
+        payload = self._payloads.get(key)
+        if payload is None:
+            payload = self._payloads[key] = self.controller.build_week_payload(week, gender)
+        return payload
+
+    def is_cached(self, week, gender=None):
+        return (week, gender) in self._payloads
+
+    def add_invalidation_listener(self, callback):
+        self._invalidation_listeners.append(callback)
+
+    def remove_invalidation_listener(self, callback):
+        if callback in self._invalidation_listeners:
+            self._invalidation_listeners.remove(callback)
+
+    def invalidate(self, gender):
+        """Скидає всі дані після зміни статі дитини"""
+        logger.info(f"Скинуто підготовлені дані тижнів: стать дитини змінено на {gender}")
+        self._payloads.clear()
+        for callback in list(self._invalidation_listeners):
+            callback(gender)
+
+
+_week_payload_cache = None
+
+
+def get_week_payload_cache():
+    """Повертає спільний для процесу кеш даних тижнів"""
+    global _week_payload_cache
+    if _week_payload_cache is None:
+        _week_payload_cache = WeekPayloadCache()
+    return _week_payload_cache
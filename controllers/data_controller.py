@@ -1,11 +1,14 @@
 from models.database import Database
 from models.services import PregnancyService
+from controllers.baby_development_controller import get_week_payload_cache
 from utils.logger import get_logger
+from utils.startup_trace import startup_trace
 
 logger = get_logger('data_controller')
 
 
 class DataController:
+    @startup_trace.traced('DataController', 'controller')
     def __init__(self, user_id=None):
         logger.info("Ініціалізація DataController")
         self.user_id = user_id
@@ -42,21 +45,30 @@ class DataController:
                 return days
         return None
 
+    def ensure_pregnancy_data(self):
+        """Дані вагітності для редагування: запис створюється лише перед першим збереженням"""
+        if not self.pregnancy_data and self.user_id:
+            self.pregnancy_data = self.db.ensure_pregnancy_data(self.user_id)
+        return self.pregnancy_data
+
     def save_user_profile(self):
         if self.user_profile:
             logger.info(f"Збереження профілю користувача: {self.user_profile.name}")
             self.db.commit()
+            self.db.invalidate_user_cache(self.user_id)
 
     def save_pregnancy_data(self):
         if self.pregnancy_data:
             logger.info("Збереження даних про вагітність")
             self.db.commit()
+            self.db.invalidate_user_cache(self.user_id)
 
     def save_child_info(self, child_data):
-        if not self.pregnancy_data:
+        if not self.ensure_pregnancy_data():
             return False
 
         logger.info(f"Збереження інформації про дитину: {child_data}")
+        previous_gender = self.pregnancy_data.baby_gender
         self.pregnancy_data.baby_gender = child_data.get('gender', 'Невідомо')
         self.pregnancy_data.baby_name = child_data.get('name', '')
 
@@ -65,8 +77,11 @@ class DataController:
 
         self.db.commit()
         if self.user_id:
+            self.db.invalidate_user_cache(self.user_id)
             self.pregnancy_data = self.db.get_pregnancy_data(self.user_id)
             self.user_profile = self.db.get_user_profile(self.user_id)
+        if self.pregnancy_data.baby_gender != previous_gender:
+            get_week_payload_cache().invalidate(self.pregnancy_data.baby_gender)
         return True
 
     def is_first_launch(self):
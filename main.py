@@ -1,11 +1,19 @@
 import os
 import sys
+from functools import partial
+from utils.startup_trace import startup_trace
+
+# Трасування починається до імпорту Qt та екранів, щоб потрапити в дерево запуску
+startup_trace.start()
+
 from PyQt6.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QStackedWidget, \
     QMessageBox, QSizePolicy
-from PyQt6.QtCore import QSize
+from PyQt6.QtCore import QSize, QTimer
 from PyQt6.QtGui import QIcon
 
 from views.weeks.weeks_screen import WeeksScreen
+from views.weeks.week_images import stop_week_image_loading
+from views.weeks.week_warmup import WeekWarmup
 from views.calendar.calendar_screen import CalendarScreen
 from views.tools.tools_screen import ToolsScreen
 from views.checklist.checklist_screen import ChecklistScreen
@@ -19,6 +27,8 @@ from views.auth.verification_screen import VerificationScreen
 
 from controllers.data_controller import DataController
 from controllers.auth_controller import AuthController
+from models.database import dispose_engines
+from utils.db_worker import stop_write_queue
 from utils.logger import get_logger
 from styles.navigation import NavigationStyles
 from styles.base import Colors
@@ -27,11 +37,30 @@ from datetime import datetime
 
 logger = get_logger('main')
 
+AUTH_SCREENS = ('login', 'register', 'verification')
+# Екран, який найімовірніше відкриють наступним: його створюємо заздалегідь, поки додаток простоює
+PREWARM_NEXT = {
+    'login': 'register',
+    'register': 'verification',
+    'verification': 'child_info',
+    'child_info': 'user_info',
+    'user_info': 'pregnancy_info',
+    'pregnancy_info': 'weeks',
+    'weeks': 'calendar',
+    'calendar': 'tools',
+    'tools': 'checklist',
+    'checklist': 'settings',
+}
+PREWARM_DELAY_MS = 500
+# PREGNANCY_PREWARM_SCREENS=0 вимикає попереднє створення екранів
+PREWARM_ENV = 'PREGNANCY_PREWARM_SCREENS'
+
 
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         logger.info("Запуск додатку 'Щоденник вагітності'")
+        self._first_paint_done = False
         self.current_user_id = None
         self.current_user_email = None
         self.data_controller = None
@@ -50,49 +79,87 @@ class MainWindow(QMainWindow):
         self.resize(min(820, screen_size.width() - 40), min(900, screen_size.height() - 60))
         self.setMinimumSize(800, 800)  # Встановлюємо мінімальний розмір вікна
 
+    def _build_screen(self, factory):
+        with startup_trace.span(factory.func.__name__, 'screen'):
+            return factory()
+
     def _create_screens(self):
+        """Реєструє фабрики екранів; самі екрани створюються при першому показі"""
         self.stack_widget = QStackedWidget()
         self.stack_widget.setStyleSheet(NavigationStyles.stack_widget())
 
-        self.auth_screens = {
-            'login': LoginScreen(self),
-            'register': RegisterScreen(self),
-            'verification': VerificationScreen(parent=self)
-        }
-
-        self.main_screens = {
-            'child_info': ChildInfoScreen(self),
-            'user_info': UserInfoScreen(self),
-            'weeks': WeeksScreen(self),
-            'calendar': CalendarScreen(self),
-            'tools': ToolsScreen(self),
-            'checklist': ChecklistScreen(self),
-            'settings': SettingsScreen(self),
-            'pregnancy_info': PregnancyInfoScreen(self)
+        self.screen_factories = {
+            'login': partial(LoginScreen, self),
+            'register': partial(RegisterScreen, self),
+            'verification': partial(VerificationScreen, parent=self),
+            'child_info': partial(ChildInfoScreen, self),
+            'user_info': partial(UserInfoScreen, self),
+            'weeks': partial(WeeksScreen, self),
+            'calendar': partial(CalendarScreen, self),
+            'tools': partial(ToolsScreen, self),
+            'checklist': partial(ChecklistScreen, self),
+            'settings': partial(SettingsScreen, self),
+            'pregnancy_info': partial(PregnancyInfoScreen, self)
         }
-
-        all_screens = {**self.auth_screens, **self.main_screens}
-        for screen in all_screens.values():
+        # Лише вже створені екрани
+        self.auth_screens = {}
+        self.main_screens = {}
+
+        self._prewarm_enabled = os.environ.get(PREWARM_ENV, '1').lower() not in ('0', 'false', 'no', 'off')
+        self._prewarm_target = None
+        self._prewarm_timer = QTimer(self)
+        self._prewarm_timer.setSingleShot(True)
+        self._prewarm_timer.timeout.connect(self._prewarm_screen)
+        self.week_warmup = WeekWarmup(self)
+
+    def get_screen(self, screen_name):
+        """Повертає екран, створюючи його при першому зверненні"""
+        screens = self.auth_screens if screen_name in AUTH_SCREENS else self.main_screens
+        screen = screens.get(screen_name)
+        if screen is None:
+            screen = screens[screen_name] = self._build_screen(self.screen_factories[screen_name])
             self.stack_widget.addWidget(screen)
-
-        self._connect_auth_signals()
-        self._connect_onboarding_signals()
-
-    def _connect_auth_signals(self):
-        self.auth_screens['login'].login_success.connect(self.on_login_success)
-        self.auth_screens['login'].switch_to_register.connect(lambda: self.show_screen('register'))
-
-        self.auth_screens['register'].registration_success.connect(self.on_registration_success)
-        self.auth_screens['register'].switch_to_login.connect(lambda: self.show_screen('login'))
-
-        self.auth_screens['verification'].verification_success.connect(self.on_verification_success)
-        self.auth_screens['verification'].back_to_register.connect(lambda: self.show_screen('register'))
-
-    def _connect_onboarding_signals(self):
-        self.main_screens['child_info'].proceed_signal.connect(self.on_child_info_completed)
-        self.main_screens['user_info'].proceed_signal.connect(self.on_user_info_completed)
-        self.main_screens['pregnancy_info'].proceed_signal.connect(self.on_pregnancy_info_completed)
-
+            self._connect_screen_signals(screen_name, screen)
+            if screen_name not in AUTH_SCREENS and self.current_user_id:
+                self._attach_user_data(screen)
+            logger.info(f"Створено екран: {screen_name}")
+        return screen
+
+    def _connect_screen_signals(self, screen_name, screen):
+        if screen_name == 'login':
+            screen.login_success.connect(self.on_login_success)
+            screen.switch_to_register.connect(lambda: self.show_screen('register'))
+        elif screen_name == 'register':
+            screen.registration_success.connect(self.on_registration_success)
+            screen.switch_to_login.connect(lambda: self.show_screen('login'))
+        elif screen_name == 'verification':
+            screen.verification_success.connect(self.on_verification_success)
+            screen.back_to_register.connect(lambda: self.show_screen('register'))
+        elif screen_name == 'child_info':
+            screen.proceed_signal.connect(self.on_child_info_completed)
+        elif screen_name == 'user_info':
+            screen.proceed_signal.connect(self.on_user_info_completed)
+        elif screen_name == 'pregnancy_info':
+            screen.proceed_signal.connect(self.on_pregnancy_info_completed)
+
+    def _is_screen_built(self, screen_name):
+        return screen_name in self.auth_screens or screen_name in self.main_screens
+
+    def _schedule_prewarm(self, screen_name):
+        self._prewarm_timer.stop()
+        target = PREWARM_NEXT.get(screen_name)
+        if not self._prewarm_enabled or target is None or self._is_screen_built(target):
+            return
+        self._prewarm_target = target
+        self._prewarm_timer.start(PREWARM_DELAY_MS)
+
+    def _prewarm_screen(self):
+        target, self._prewarm_target = self._prewarm_target, None
+        if target is not None and not self._is_screen_built(target):
+            logger.info(f"Попереднє створення екрану: {target}")
+            self.get_screen(target)
+
+    @startup_trace.traced('MainWindow._setup_navigation')
     def _setup_navigation(self):
         nav_items = [
             {"icon": "resources/images/icons/weeks.png", "text": "Тижні", "screen": "weeks"},
@@ -142,6 +209,7 @@ class MainWindow(QMainWindow):
         self.main_layout.addWidget(self.bottom_nav)
         self.setCentralWidget(main_widget)
 
+    @startup_trace.traced('MainWindow._handle_authentication')
     def _handle_authentication(self):
         session_data = self.auth_controller.load_session()
         if session_data:
@@ -160,16 +228,14 @@ class MainWindow(QMainWindow):
                 self._update_screens_with_user_data()
                 self.bottom_nav.setVisible(True)
                 self.show_screen('weeks')
+                self._start_week_warmup()
         else:
             self.bottom_nav.setVisible(False)
             self.show_screen('login')
 
     def show_screen(self, screen_name):
-        if screen_name in self.auth_screens:
-            screen = self.auth_screens[screen_name]
-        else:
-            screen = self.main_screens[screen_name]
-        self.stack_widget.setCurrentWidget(screen)
+        self.stack_widget.setCurrentWidget(self.get_screen(screen_name))
+        self._schedule_prewarm(screen_name)
 
     def on_login_success(self, user_data):
         logger.info(f"Успішний вхід користувача {user_data['email']}")
@@ -187,10 +253,11 @@ class MainWindow(QMainWindow):
             self._update_screens_with_user_data()
             self.bottom_nav.setVisible(True)
             self.show_screen('weeks')
+            self._start_week_warmup()
 
     def on_registration_success(self, email):
         logger.info(f"Успішна реєстрація користувача {email}")
-        verification_screen = self.auth_screens['verification']
+        verification_screen = self.get_screen('verification')
         verification_screen.set_email(email)
         self.show_screen('verification')
 
@@ -203,6 +270,7 @@ class MainWindow(QMainWindow):
         self.show_screen('child_info')
         self.bottom_nav.setVisible(False)
 
+    @startup_trace.traced('MainWindow._init_reminder_service')
     def _init_reminder_service(self):
         if self.data_controller:
             self.reminder_service = ReminderService(
@@ -212,18 +280,27 @@ class MainWindow(QMainWindow):
             )
             self.reminder_service.start()
 
+    @startup_trace.traced('MainWindow._update_screens_with_user_data')
     def _update_screens_with_user_data(self):
-        for screen_name, screen in self.main_screens.items():
-            if hasattr(screen, 'data_controller'):
-                screen.data_controller = DataController(self.current_user_id)
-            if hasattr(screen, 'parent'):
-                screen.parent = self
+        # Ще не створені екрани отримають дані користувача при створенні
+        for screen in self.main_screens.values():
+            self._attach_user_data(screen)
+
+    def _start_week_warmup(self):
+        # Після входу всі тижні готуються у вільний час, щоб перемикання тижнів не звертались до даних
+        if self.data_controller:
+            self.week_warmup.start(self.data_controller.get_child_info()["gender"], self.devicePixelRatioF())
+
+    def _attach_user_data(self, screen):
+        if hasattr(screen, 'data_controller'):
+            screen.data_controller = DataController(self.current_user_id)
+        if hasattr(screen, 'parent'):
+            screen.parent = self
 
     def navigate_to(self, screen_name):
         logger.info(f"Перехід на екран: {screen_name}")
         self.show_screen(screen_name)
 
-        screen_indices = list(self.main_screens.keys())
         main_screens = ['weeks', 'calendar', 'tools', 'checklist', 'settings']
 
         for i, button in enumerate(self.nav_buttons):
@@ -251,13 +328,15 @@ class MainWindow(QMainWindow):
                 return
 
             if self.data_controller:
-                self.data_controller.pregnancy_data.last_period_date = last_period
-                self.data_controller.pregnancy_data.conception_date = conception
+                pregnancy = self.data_controller.ensure_pregnancy_data()
+                pregnancy.last_period_date = last_period
+                pregnancy.conception_date = conception
                 self.data_controller.save_pregnancy_data()
 
                 self._update_screens_with_user_data()
                 self.bottom_nav.setVisible(True)
                 self.show_screen('weeks')
+                self._start_week_warmup()
         except Exception as e:
             QMessageBox.critical(self, "Помилка", f"Не вдалося зберегти інформацію про вагітність: {str(e)}")
 
@@ -266,6 +345,7 @@ class MainWindow(QMainWindow):
         self.current_user_id = None
         self.current_user_email = None
         self.data_controller = None
+        self.week_warmup.stop()
         if self.reminder_service:
             self.reminder_service.stop()
             self.reminder_service = None
@@ -274,17 +354,32 @@ class MainWindow(QMainWindow):
         self.show_screen('login')
         logger.info("Користувач вийшов з системи")
 
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self._first_paint_done:
+            self._first_paint_done = True
+            startup_trace.finish()
+
     def closeEvent(self, event):
         if self.reminder_service:
             self.reminder_service.stop()
+        self.week_warmup.stop()
+        stop_week_image_loading()
+        stop_write_queue()
+        dispose_engines()
         logger.info("Завершення роботи додатку")
         event.accept()
 
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    app.setStyle("Fusion")
-
-    window = MainWindow()
-    window.show()
+    with startup_trace.span('QApplication'):
+        app = QApplication(sys.argv)
+        app.setStyle("Fusion")
+
+    with startup_trace.span('MainWindow'):
+        window = MainWindow()
+    with startup_trace.span('MainWindow.show'):
+        window.show()
+    # Закривається в MainWindow.paintEvent разом з усім трасуванням
+    startup_trace.begin('Перше відмальовування', 'paint')
     sys.exit(app.exec())
\ No newline at end of file
@@ -1,10 +1,16 @@
 from .base import UserProfile, PregnancyData, WeightRecord, CalendarEvent, MedicalCheck, WishlistItem, HealthNote, BabyKick, Contraction, BloodPressure, BellyMeasurement, Reminder
 from .database import Database
+from .development_content import WeekContent, DevelopmentContent, get_development_content
+from .records import WeightRow, BabyKickRow, ContractionRow, BloodPressureRow, BellyMeasurementRow, HealthNoteRow, \
+    MetricStatsRow
 from .services import PregnancyService, UserService, MedicalCheckService
 
 __all__ = [
     'UserProfile', 'PregnancyData', 'WeightRecord',
     'CalendarEvent', 'MedicalCheck', 'WishlistItem', 'HealthNote',
     'BabyKick', 'Contraction', 'BloodPressure', 'BellyMeasurement', 'Reminder',
+    'WeightRow', 'BabyKickRow', 'ContractionRow', 'BloodPressureRow', 'BellyMeasurementRow', 'HealthNoteRow',
+    'MetricStatsRow',
+    'WeekContent', 'DevelopmentContent', 'get_development_content',
     'Database', 'PregnancyService', 'UserService', 'MedicalCheckService'
 ]
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, Float, Date, Time, DateTime
+from sqlalchemy import Column, Integer, String, Text, Boolean, Float, Date, Time, DateTime, Index
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
 
@@ -45,6 +45,9 @@ class PregnancyData(Base):
 
 class WeightRecord(Base):
     __tablename__ = 'weight_records'
+    __table_args__ = (
+        Index('ix_weight_records_user_date', 'user_id', 'date'),
+    )
 
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, default=1)
@@ -54,6 +57,9 @@ class WeightRecord(Base):
 
 class CalendarEvent(Base):
     __tablename__ = 'calendar_events'
+    __table_args__ = (
+        Index('ix_calendar_events_user_start_date', 'user_id', 'start_date'),
+    )
 
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, default=1)
@@ -100,6 +106,9 @@ class WishlistItem(Base):
 
 class HealthNote(Base):
     __tablename__ = 'health_notes'
+    __table_args__ = (
+        Index('ix_health_notes_user_date', 'user_id', 'date'),
+    )
 
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, default=1)
@@ -110,6 +119,9 @@ class HealthNote(Base):
 
 class BabyKick(Base):
     __tablename__ = 'baby_kicks'
+    __table_args__ = (
+        Index('ix_baby_kicks_user_date_time', 'user_id', 'date', 'time'),
+    )
 
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, default=1)
@@ -120,6 +132,9 @@ class BabyKick(Base):
 
 class Contraction(Base):
     __tablename__ = 'contractions'
+    __table_args__ = (
+        Index('ix_contractions_user_date_start', 'user_id', 'date', 'start_time'),
+    )
 
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, default=1)
@@ -132,6 +147,9 @@ class Contraction(Base):
 
 class BloodPressure(Base):
     __tablename__ = 'blood_pressure'
+    __table_args__ = (
+        Index('ix_blood_pressure_user_date_time', 'user_id', 'date', 'time'),
+    )
 
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, default=1)
@@ -145,6 +163,9 @@ class BloodPressure(Base):
 
 class BellyMeasurement(Base):
     __tablename__ = 'belly_measurements'
+    __table_args__ = (
+        Index('ix_belly_measurements_user_date', 'user_id', 'date'),
+    )
 
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, default=1)
@@ -165,4 +186,33 @@ class Reminder(Base):
     is_active = Column(Boolean, default=True)
     is_completed = Column(Boolean, default=False)
     reminder_type = Column(String(50), default='custom')
-    created_at = Column(DateTime, default=datetime.utcnow)
\ No newline at end of file
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class DailyRollup(Base):
+    """Денні підсумки показників трекерів, які підтримуються тригерами SQLite"""
+    __tablename__ = 'daily_rollups'
+
+    user_id = Column(Integer, primary_key=True)
+    day = Column(Date, primary_key=True)
+    metric = Column(String(50), primary_key=True)
+    count = Column(Integer, default=0)
+    total = Column(Float, default=0)
+    min_value = Column(Float)
+    max_value = Column(Float)
+    last_value = Column(Float)
+    last_time = Column(String(20))
+    last_id = Column(Integer)
+
+
+# Показники трекерів для агрегації: (модель, колонка значення, колонка часу або None)
+TRACKER_METRICS = {
+    'weight': (WeightRecord, 'weight', None),
+    'kicks': (BabyKick, 'count', 'time'),
+    'contraction_duration': (Contraction, 'duration', 'start_time'),
+    'contraction_intensity': (Contraction, 'intensity', 'start_time'),
+    'systolic': (BloodPressure, 'systolic', 'time'),
+    'diastolic': (BloodPressure, 'diastolic', 'time'),
+    'pulse': (BloodPressure, 'pulse', 'time'),
+    'belly': (BellyMeasurement, 'measurement', None),
+}
\ No newline at end of file
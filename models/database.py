@@ -1,33 +1,286 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import base64
+import json
+import os
+import threading
+import time
+from sqlalchemy import Integer, String, case, cast, create_engine, event, func, insert, select, tuple_, type_coerce
+from sqlalchemy.orm import sessionmaker, scoped_session
+from . import query_stats, rollups
 from .base import Base, UserProfile, PregnancyData, WeightRecord, \
-    WishlistItem, HealthNote, BabyKick, Contraction, BloodPressure, BellyMeasurement, Reminder
+    WishlistItem, HealthNote, BabyKick, Contraction, BloodPressure, BellyMeasurement, Reminder, DailyRollup, \
+    TRACKER_METRICS
 from datetime import datetime, date, timedelta
 from models.base import CalendarEvent
+from .records import WeightRow, BabyKickRow, ContractionRow, BloodPressureRow, BellyMeasurementRow, HealthNoteRow, \
+    MetricStatsRow
+from utils.logger import get_logger
+
+logger = get_logger('database')
+
+
+DEFAULT_DB_PATH = 'pregnancy_diary.db'
+
+STATS_BUCKETS = ('day', 'week', 'pregnancy_week')
+
+# Профілі зберігання: PRAGMA, що застосовуються до кожного нового з'єднання SQLite
+STORAGE_PROFILES = {
+    'durable': {
+        'journal_mode': 'DELETE',
+        'synchronous': 'FULL',
+        'cache_size': -2000,
+        'mmap_size': 0,
+        'temp_store': 'DEFAULT',
+        'busy_timeout': 5000,
+    },
+    'balanced': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'cache_size': -16000,
+        'mmap_size': 64 * 1024 * 1024,
+        'temp_store': 'MEMORY',
+        'busy_timeout': 5000,
+    },
+    'fast': {
+        'journal_mode': 'WAL',
+        'synchronous': 'OFF',
+        'cache_size': -64000,
+        'mmap_size': 256 * 1024 * 1024,
+        'temp_store': 'MEMORY',
+        'busy_timeout': 5000,
+    },
+}
+DEFAULT_STORAGE_PROFILE = 'balanced'
+STORAGE_PROFILE_ENV = 'PREGNANCY_DB_PROFILE'
+
+# Один рушій і одна фабрика сесій на файл бази даних для всього процесу
+_engines = {}
+_session_factories = {}
+_registry_lock = threading.Lock()
+
+# Лічильники кешу профілів і даних вагітності (спільні для всіх екземплярів Database)
+_entity_cache_stats = {'hits': 0, 'misses': 0, 'invalidations': 0}
+
+
+def _registry_key(db_path):
+    return db_path if db_path == ':memory:' else os.path.abspath(db_path)
+
+
+def get_storage_profile_name(profile=None):
+    """Визначає активний профіль: аргумент, змінна середовища або профіль за замовчуванням"""
+    name = profile or os.environ.get(STORAGE_PROFILE_ENV) or DEFAULT_STORAGE_PROFILE
+    if name not in STORAGE_PROFILES:
+        logger.warning(f"Невідомий профіль зберігання '{name}', використовуємо '{DEFAULT_STORAGE_PROFILE}'")
+        name = DEFAULT_STORAGE_PROFILE
+    return name
+
+
+def _apply_storage_profile(engine, profile_name):
+    pragmas = STORAGE_PROFILES[profile_name]
+
+    @event.listens_for(engine, 'connect')
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name}={value}')
+        cursor.close()
+
+
+def upgrade_schema(engine):
+    """Додає до вже існуючих таблиць індекси, яких у них ще немає"""
+    # create_all створює індекси лише разом з новими таблицями
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+    with engine.begin() as connection:
+        if rollups.install_triggers(connection):
+            # Тригери щойно з'явилися: підсумки для вже наявних записів рахуємо з нуля
+            logger.info(f"Перебудовано денні підсумки: {rollups.rebuild(connection)} рядків")
+
+
+def get_engine(db_path=DEFAULT_DB_PATH, profile=None):
+    """Повертає спільний рушій для файлу бази, створюючи його та схему лише один раз"""
+    key = _registry_key(db_path)
+    with _registry_lock:
+        engine = _engines.get(key)
+        if engine is not None and profile is not None and get_storage_profile_name(profile) != engine.storage_profile:
+            logger.warning(f"Рушій бази {db_path} вже створено з профілем '{engine.storage_profile}', "
+                           f"профіль '{profile}' проігноровано")
+        if engine is None:
+            profile_name = get_storage_profile_name(profile)
+            engine = create_engine(f'sqlite:///{db_path}')
+            _apply_storage_profile(engine, profile_name)
+            engine.storage_profile = profile_name
+            logger.info(f"Створено рушій бази {db_path} з профілем зберігання '{profile_name}'")
+            Base.metadata.create_all(engine)
+            upgrade_schema(engine)
+            if query_stats.is_enabled():
+                query_stats.instrument(engine)
+            _engines[key] = engine
+            # Ключ за ідентифікатором потоку, а не threading.local: дані threading.local
+            # втрачаються між викликами слотів у потоках QThread
+            _session_factories[key] = scoped_session(sessionmaker(bind=engine), scopefunc=threading.get_ident)
+        return engine
+
+
+def get_session_factory(db_path=DEFAULT_DB_PATH):
+    """Повертає scoped_session-фабрику, прив'язану до спільного рушія"""
+    get_engine(db_path)
+    return _session_factories[_registry_key(db_path)]
+
+
+def release_thread_session(db_path=DEFAULT_DB_PATH):
+    """Закриває сесію поточного потоку (при завершенні потоку, який працював з базою)"""
+    factory = _session_factories.get(_registry_key(db_path))
+    if factory is not None:
+        factory.remove()
+
+
+def dispose_engines():
+    """Закриває всі сесії та пули з'єднань (при завершенні роботи додатку)"""
+    with _registry_lock:
+        for factory in _session_factories.values():
+            factory.remove()
+        for engine in _engines.values():
+            stats = getattr(engine, 'query_stats', None)
+            if stats is not None:
+                stats.log_summary()
+            engine.dispose()
+        _session_factories.clear()
+        _engines.clear()
 
 
 class Database:
-    def __init__(self, db_path='pregnancy_diary.db'):
-        self.engine = create_engine(f'sqlite:///{db_path}')
-        Base.metadata.create_all(self.engine)
-        Session = sessionmaker(bind=self.engine)
-        self.session = Session()
+    def __init__(self, db_path=DEFAULT_DB_PATH, profile=None):
+        self.db_path = db_path
+        self.engine = get_engine(db_path, profile)
+        self._session_factory = get_session_factory(db_path)
+        self._group_commit = None
+        self._pending_writes = 0
+        self._pending_since = None
+        self._group_commit_stats = {'batches': 0, 'rows': 0, 'max_batch': 0,
+                                    'flush_seconds': 0.0, 'max_flush_seconds': 0.0}
+
+    @property
+    def session(self):
+        # Усі екземпляри Database в одному потоці працюють з однією сесією
+        return self._session_factory()
+
+    def enable_group_commit(self, window=0.25, max_batch=50):
+        """Об'єднує записи _add_record, що надійшли протягом window секунд або до max_batch штук, в один commit"""
+        self._group_commit = {'window': window, 'max_batch': max_batch}
+        logger.info(f"Групові коміти увімкнено: вікно {window} с, до {max_batch} записів")
+
+    def disable_group_commit(self):
+        self.flush_pending()
+        self._group_commit = None
+
+    @property
+    def group_commit_window(self):
+        return self._group_commit['window'] if self._group_commit else None
+
+    @property
+    def pending_writes(self):
+        return self._pending_writes
+
+    def pending_age(self):
+        return time.perf_counter() - self._pending_since if self._pending_writes else 0.0
+
+    def _group_commit_due(self):
+        return (self._pending_writes >= self._group_commit['max_batch'] or
+                self.pending_age() >= self._group_commit['window'])
+
+    def flush_pending(self):
+        """Комітить накопичені групові записи; повертає їх кількість"""
+        batch = self._pending_writes
+        if not batch:
+            return 0
+
+        started = time.perf_counter()
+        self._pending_writes = 0
+        self._pending_since = None
+        try:
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        elapsed = time.perf_counter() - started
+
+        stats = self._group_commit_stats
+        stats['batches'] += 1
+        stats['rows'] += batch
+        stats['max_batch'] = max(stats['max_batch'], batch)
+        stats['flush_seconds'] += elapsed
+        stats['max_flush_seconds'] = max(stats['max_flush_seconds'], elapsed)
+        return batch
+
+    def get_group_commit_stats(self):
+        stats = dict(self._group_commit_stats)
+        batches = stats['batches']
+        stats['avg_batch'] = stats['rows'] / batches if batches else 0.0
+        stats['avg_flush_ms'] = stats['flush_seconds'] * 1000 / batches if batches else 0.0
+        stats['max_flush_ms'] = stats['max_flush_seconds'] * 1000
+        stats['pending'] = self._pending_writes
+        return stats
+
+    def _entity_cache(self):
+        # Кеш живе в сесії потоку: об'єкти в ньому прив'язані саме до неї та зникають разом із нею
+        return self.session.info.setdefault('entity_cache', {})
+
+    def _cached_entity(self, model_class, user_id, load):
+        cache = self._entity_cache()
+        key = (model_class.__name__, user_id)
+        if key in cache:
+            _entity_cache_stats['hits'] += 1
+            return cache[key]
+        _entity_cache_stats['misses'] += 1
+        cache[key] = entity = load()
+        return entity
 
     def get_user_profile(self, user_id):
-        return self.session.query(UserProfile).filter_by(id=user_id).first()
+        return self._cached_entity(UserProfile, user_id,
+                                   lambda: self.session.query(UserProfile).filter_by(id=user_id).first())
 
     def get_pregnancy_data(self, user_id):
-        pregnancy = self.session.query(PregnancyData).filter_by(user_id=user_id).first()
-        if not pregnancy:
+        """Дані вагітності користувача або None; запис створює лише ensure_pregnancy_data"""
+        return self._cached_entity(PregnancyData, user_id,
+                                   lambda: self.session.query(PregnancyData).filter_by(user_id=user_id).first())
+
+    def ensure_pregnancy_data(self, user_id):
+        """Повертає дані вагітності, створюючи порожній запис, якщо його ще немає"""
+        pregnancy = self.get_pregnancy_data(user_id)
+        if pregnancy is None:
             pregnancy = PregnancyData(user_id=user_id, baby_gender="Невідомо", baby_name="")
             self.session.add(pregnancy)
             self.session.commit()
+            self._entity_cache()[(PregnancyData.__name__, user_id)] = pregnancy
         return pregnancy
 
+    def invalidate_user_cache(self, user_id=None):
+        """Скидає закешовані профіль і дані вагітності користувача (або всіх, якщо user_id не задано)"""
+        cache = self._entity_cache()
+        if user_id is None:
+            cache.clear()
+        else:
+            for model_class in (UserProfile, PregnancyData):
+                cache.pop((model_class.__name__, user_id), None)
+        _entity_cache_stats['invalidations'] += 1
+
+    def get_query_stats(self):
+        """Зведення замірів SQL-запитів рушія (порожнє, якщо заміри не увімкнені)"""
+        stats = getattr(self.engine, 'query_stats', None)
+        return stats.summary() if stats is not None else []
+
+    def get_entity_cache_stats(self):
+        """Влучання та промахи кешу профілів і даних вагітності"""
+        stats = dict(_entity_cache_stats)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        return stats
+
     def _parse_date_time(self, date_str, time_str=None):
         date_obj = datetime.strptime(date_str, '%Y-%m-%d').date()
         if time_str:
-            time_obj = datetime.strptime(time_str, '%H:%M:%S' if ':' in time_str[2:] else '%H:%M').time()
+            time_obj = datetime.strptime(time_str, '%H:%M:%S' if time_str.count(':') == 2 else '%H:%M').time()
             return date_obj, time_obj
         return date_obj
 
@@ -36,101 +289,312 @@ class Database:
             kwargs['user_id'] = 1
         record = model_class(**kwargs)
         self.session.add(record)
-        self.session.commit()
+
+        if not self._group_commit:
+            self.session.commit()
+            return record.id
+
+        # У груповому режимі лише отримуємо id через flush, commit буде спільним
+        try:
+            self.session.flush()
+        except Exception:
+            self.rollback()
+            raise
+
+        if not self._pending_writes:
+            self._pending_since = time.perf_counter()
+        self._pending_writes += 1
+        if self._group_commit_due():
+            self.flush_pending()
         return record.id
 
-    def _get_records(self, model_class, user_id=1, days=None, order_by=None, format_func=None):
-        query = self.session.query(model_class).filter_by(user_id=user_id)
+    def _add_records(self, model_class, rows, user_id=1):
+        """Вставляє всі рядки однією транзакцією через executemany та повертає їхні id"""
+        rows = [{'user_id': user_id, **row} for row in rows]
+        if not rows:
+            return []
+
+        table = model_class.__table__
+        started = time.perf_counter()
+        # sort_by_parameter_order змушує SQLAlchemy вставляти в SQLite по рядку; натомість вставляємо
+        # пакетами VALUES і сортуємо id: у межах транзакції SQLite видає rowid за зростанням у порядку рядків
+        stmt = insert(table).returning(table.c.id)
+        ids = sorted(self.session.execute(stmt, rows).scalars())
+        self.session.commit()
+        elapsed = time.perf_counter() - started
+
+        rate = len(ids) / elapsed if elapsed > 0 else float('inf')
+        logger.info(f"Додано {len(ids)} записів у {table.name} за {elapsed:.3f} с ({rate:.0f} записів/с)")
+        return ids
+
+    def _date_text(self, column):
+        # SQLite зберігає дату як 'YYYY-MM-DD', тож читаємо рядок без перетворення в date
+        return type_coerce(column, String)
+
+    def _time_text(self, column, with_seconds=False):
+        # Час зберігається як 'HH:MM:SS.ffffff', обрізаємо його вже в SQL
+        return func.substr(column, 1, 8 if with_seconds else 5)
+
+    def _select_rows(self, model_class, row_type, columns, user_id=1, days=None, order_by=None):
+        """Читає лише потрібні колонки через Core select, без гідратації ORM-об'єктів"""
+        stmt = select(*columns).where(model_class.user_id == user_id)
 
         if days and hasattr(model_class, 'date'):
             start_date = date.today() - timedelta(days=days)
-            query = query.filter(model_class.date >= start_date)
+            stmt = stmt.where(model_class.date >= start_date)
 
         if order_by:
-            query = query.order_by(*order_by)
+            stmt = stmt.order_by(*order_by)
+
+        return [row_type._make(row) for row in self.session.execute(stmt)]
 
-        records = query.all()
-        return [format_func(r) for r in records] if format_func else records
+    def _encode_cursor(self, values):
+        raw = json.dumps([v if isinstance(v, int) else v.isoformat() for v in values])
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    def _decode_cursor(self, cursor, key_columns):
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return [v if col.type.python_type is int else col.type.python_type.fromisoformat(v)
+                for col, v in zip(key_columns, values)]
+
+    def _select_page(self, model_class, row_type, columns, key_columns, user_id=1, limit=50, cursor=None):
+        """Keyset-пагінація від найновіших записів: повертає (сторінка, курсор наступної сторінки або None)"""
+        key_columns = [*key_columns, model_class.id]
+        stmt = select(*columns, *key_columns).where(model_class.user_id == user_id)
+
+        if cursor:
+            stmt = stmt.where(tuple_(*key_columns) < tuple_(*self._decode_cursor(cursor, key_columns)))
+
+        # Беремо на один запис більше, щоб знати, чи є наступна сторінка
+        stmt = stmt.order_by(*[col.desc() for col in key_columns]).limit(limit + 1)
+        rows = self.session.execute(stmt).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = self._encode_cursor(rows[-1][len(columns):])
+
+        return [row_type._make(row[:len(columns)]) for row in rows], next_cursor
+
+    def _weight_row(self, date_str, weight):
+        return {'date': self._parse_date_time(date_str), 'weight': weight}
 
     def add_weight_record(self, date_str, weight, user_id=1):
-        date_obj = self._parse_date_time(date_str)
-        return self._add_record(WeightRecord, date=date_obj, weight=weight, user_id=user_id)
+        return self._add_record(WeightRecord, user_id=user_id, **self._weight_row(date_str, weight))
+
+    def add_weight_record_many(self, records, user_id=1):
+        return self._add_records(WeightRecord, (self._weight_row(*r) for r in records), user_id=user_id)
+
+    def _weight_columns(self):
+        return [WeightRecord.id, self._date_text(WeightRecord.date), WeightRecord.weight]
 
     def get_weight_records(self, user_id=1):
-        records = self._get_records(WeightRecord, user_id=user_id, order_by=[WeightRecord.date])
-        return [(r.date.strftime('%Y-%m-%d'), r.weight) for r in records]
+        records = self._select_rows(WeightRecord, WeightRow, self._weight_columns(), user_id=user_id,
+                                    order_by=[WeightRecord.date])
+        return [(r.date, r.weight) for r in records]
 
-    def add_baby_kick(self, date_str, time_str, count, user_id=1):
+    def get_weight_records_page(self, user_id=1, limit=50, cursor=None):
+        return self._select_page(WeightRecord, WeightRow, self._weight_columns(), [WeightRecord.date],
+                                 user_id=user_id, limit=limit, cursor=cursor)
+
+    def _kick_row(self, date_str, time_str, count):
         date_obj, time_obj = self._parse_date_time(date_str, time_str)
-        return self._add_record(BabyKick, date=date_obj, time=time_obj, count=count, user_id=user_id)
+        return {'date': date_obj, 'time': time_obj, 'count': count}
+
+    def add_baby_kick(self, date_str, time_str, count, user_id=1):
+        return self._add_record(BabyKick, user_id=user_id, **self._kick_row(date_str, time_str, count))
+
+    def add_baby_kick_many(self, kicks, user_id=1):
+        return self._add_records(BabyKick, (self._kick_row(*k) for k in kicks), user_id=user_id)
 
     def get_baby_kicks(self, user_id=1, days=7):
-        def format_kick(k):
-            return {'id': k.id, 'date': k.date.strftime('%Y-%m-%d'),
-                    'time': k.time.strftime('%H:%M'), 'count': k.count}
+        columns = [BabyKick.id, self._date_text(BabyKick.date), self._time_text(BabyKick.time), BabyKick.count]
+        return self._select_rows(BabyKick, BabyKickRow, columns, user_id=user_id, days=days,
+                                 order_by=[BabyKick.date.desc(), BabyKick.time.desc()])
 
-        return self._get_records(BabyKick, user_id=user_id, days=days,
-                                 order_by=[BabyKick.date.desc(), BabyKick.time.desc()],
-                                 format_func=format_kick)
+    def _contraction_row(self, date_str, start_time_str, end_time_str, duration, intensity):
+        return {'date': self._parse_date_time(date_str),
+                'start_time': datetime.strptime(start_time_str, '%H:%M:%S').time(),
+                'end_time': datetime.strptime(end_time_str, '%H:%M:%S').time(),
+                'duration': duration, 'intensity': intensity}
 
     def add_contraction(self, date_str, start_time_str, end_time_str, duration, intensity, user_id=1):
-        date_obj = self._parse_date_time(date_str)
-        start_time = datetime.strptime(start_time_str, '%H:%M:%S').time()
-        end_time = datetime.strptime(end_time_str, '%H:%M:%S').time()
-        return self._add_record(Contraction, date=date_obj, start_time=start_time,
-                                end_time=end_time, duration=duration, intensity=intensity, user_id=user_id)
+        row = self._contraction_row(date_str, start_time_str, end_time_str, duration, intensity)
+        return self._add_record(Contraction, user_id=user_id, **row)
 
-    def get_contractions(self, user_id=1, days=1):
-        def format_contraction(c):
-            return {'id': c.id, 'date': c.date.strftime('%Y-%m-%d'),
-                    'start_time': c.start_time.strftime('%H:%M:%S'),
-                    'end_time': c.end_time.strftime('%H:%M:%S'),
-                    'duration': c.duration, 'intensity': c.intensity}
+    def add_contraction_many(self, contractions, user_id=1):
+        return self._add_records(Contraction, (self._contraction_row(*c) for c in contractions), user_id=user_id)
 
-        return self._get_records(Contraction, user_id=user_id, days=days,
-                                 order_by=[Contraction.date.desc(), Contraction.start_time.desc()],
-                                 format_func=format_contraction)
+    def get_contractions(self, user_id=1, days=1):
+        columns = [Contraction.id, self._date_text(Contraction.date),
+                   self._time_text(Contraction.start_time, with_seconds=True),
+                   self._time_text(Contraction.end_time, with_seconds=True),
+                   Contraction.duration, Contraction.intensity]
+        return self._select_rows(Contraction, ContractionRow, columns, user_id=user_id, days=days,
+                                 order_by=[Contraction.date.desc(), Contraction.start_time.desc()])
+
+    def _blood_pressure_row(self, date_str, time_str, systolic, diastolic, pulse=None, notes=''):
+        date_obj, time_obj = self._parse_date_time(date_str, time_str)
+        return {'date': date_obj, 'time': time_obj, 'systolic': systolic,
+                'diastolic': diastolic, 'pulse': pulse, 'notes': notes}
 
     def add_blood_pressure(self, date_str, time_str, systolic, diastolic, pulse=None, notes='', user_id=1):
-        date_obj, time_obj = self._parse_date_time(date_str, time_str)
-        return self._add_record(BloodPressure, date=date_obj, time=time_obj, systolic=systolic,
-                                diastolic=diastolic, pulse=pulse, notes=notes, user_id=user_id)
+        row = self._blood_pressure_row(date_str, time_str, systolic, diastolic, pulse, notes)
+        return self._add_record(BloodPressure, user_id=user_id, **row)
+
+    def add_blood_pressure_many(self, records, user_id=1):
+        return self._add_records(BloodPressure, (self._blood_pressure_row(*r) for r in records), user_id=user_id)
+
+    def _blood_pressure_columns(self):
+        return [BloodPressure.id, self._date_text(BloodPressure.date), self._time_text(BloodPressure.time),
+                BloodPressure.systolic, BloodPressure.diastolic, BloodPressure.pulse, BloodPressure.notes]
 
     def get_blood_pressure(self, user_id=1, days=30):
-        def format_bp(r):
-            return {'id': r.id, 'date': r.date.strftime('%Y-%m-%d'),
-                    'time': r.time.strftime('%H:%M'), 'systolic': r.systolic,
-                    'diastolic': r.diastolic, 'pulse': r.pulse, 'notes': r.notes}
+        return self._select_rows(BloodPressure, BloodPressureRow, self._blood_pressure_columns(),
+                                 user_id=user_id, days=days,
+                                 order_by=[BloodPressure.date.desc(), BloodPressure.time.desc()])
+
+    def get_blood_pressure_page(self, user_id=1, limit=50, cursor=None):
+        return self._select_page(BloodPressure, BloodPressureRow, self._blood_pressure_columns(),
+                                 [BloodPressure.date, BloodPressure.time], user_id=user_id, limit=limit, cursor=cursor)
 
-        return self._get_records(BloodPressure, user_id=user_id, days=days,
-                                 order_by=[BloodPressure.date.desc(), BloodPressure.time.desc()],
-                                 format_func=format_bp)
+    def _belly_row(self, date_str, measurement, notes=''):
+        return {'date': self._parse_date_time(date_str), 'measurement': measurement, 'notes': notes}
 
     def add_belly_measurement(self, date_str, measurement, notes='', user_id=1):
-        date_obj = self._parse_date_time(date_str)
-        return self._add_record(BellyMeasurement, date=date_obj, measurement=measurement, notes=notes, user_id=user_id)
+        return self._add_record(BellyMeasurement, user_id=user_id, **self._belly_row(date_str, measurement, notes))
+
+    def add_belly_measurement_many(self, measurements, user_id=1):
+        return self._add_records(BellyMeasurement, (self._belly_row(*m) for m in measurements), user_id=user_id)
+
+    def _belly_columns(self):
+        return [BellyMeasurement.id, self._date_text(BellyMeasurement.date),
+                BellyMeasurement.measurement, BellyMeasurement.notes]
 
     def get_belly_measurements(self, user_id=1):
-        def format_measurement(m):
-            return {'id': m.id, 'date': m.date.strftime('%Y-%m-%d'),
-                    'measurement': m.measurement, 'notes': m.notes}
+        return self._select_rows(BellyMeasurement, BellyMeasurementRow, self._belly_columns(), user_id=user_id,
+                                 order_by=[BellyMeasurement.date.desc()])
+
+    def get_belly_measurements_page(self, user_id=1, limit=50, cursor=None):
+        return self._select_page(BellyMeasurement, BellyMeasurementRow, self._belly_columns(),
+                                 [BellyMeasurement.date], user_id=user_id, limit=limit, cursor=cursor)
 
-        return self._get_records(BellyMeasurement, user_id=user_id,
-                                 order_by=[BellyMeasurement.date.desc()],
-                                 format_func=format_measurement)
+    def _note_row(self, date_str, content, title=''):
+        return {'date': self._parse_date_time(date_str), 'content': content, 'title': title}
 
     def add_health_note(self, date_str, content, title='', user_id=1):
-        date_obj = self._parse_date_time(date_str)
-        return self._add_record(HealthNote, date=date_obj, content=content, title=title, user_id=user_id)
+        return self._add_record(HealthNote, user_id=user_id, **self._note_row(date_str, content, title))
 
-    def get_health_notes(self, user_id=1):
-        def format_note(n):
-            return {'id': n.id, 'date': n.date.strftime('%Y-%m-%d'),
-                    'content': n.content, 'title': n.title}
+    def add_health_note_many(self, notes, user_id=1):
+        return self._add_records(HealthNote, (self._note_row(*n) for n in notes), user_id=user_id)
+
+    def _health_note_columns(self):
+        return [HealthNote.id, self._date_text(HealthNote.date), HealthNote.content, HealthNote.title]
 
-        return self._get_records(HealthNote, user_id=user_id,
-                                 order_by=[HealthNote.date.desc()],
-                                 format_func=format_note)
+    def get_health_notes(self, user_id=1):
+        return self._select_rows(HealthNote, HealthNoteRow, self._health_note_columns(), user_id=user_id,
+                                 order_by=[HealthNote.date.desc()])
+
+    def get_health_notes_page(self, user_id=1, limit=50, cursor=None):
+        return self._select_page(HealthNote, HealthNoteRow, self._health_note_columns(),
+                                 [HealthNote.date], user_id=user_id, limit=limit, cursor=cursor)
+
+    def _bucket_expression(self, bucket, date_column, user_id):
+        if bucket == 'day':
+            return self._date_text(date_column)
+        if bucket == 'week':
+            # Понеділок тижня, до якого належить дата
+            return func.date(date_column, 'weekday 0', '-6 days')
+        if bucket == 'pregnancy_week':
+            last_period_date = self.session.execute(
+                select(PregnancyData.last_period_date).where(PregnancyData.user_id == user_id)
+            ).scalar()
+            if not last_period_date:
+                return None
+            days_pregnant = func.julianday(date_column) - func.julianday(last_period_date.isoformat())
+            return cast(days_pregnant / 7, Integer)
+        raise ValueError(f"Невідомий період агрегації: {bucket}")
+
+    def get_metric_stats(self, metric, bucket='day', user_id=1, days=None):
+        """Кількість, середнє, мінімум, максимум, останнє значення та сума показника по періодах.
+
+        Читає денні підсумки daily_rollups, тож вартість залежить від кількості днів, а не записів.
+        """
+        if metric not in TRACKER_METRICS:
+            raise ValueError(f"Невідомий показник: {metric}")
+
+        bucket_expr = self._bucket_expression(bucket, DailyRollup.day, user_id)
+        if bucket_expr is None:
+            logger.warning(f"Немає дати останньої менструації для користувача {user_id}, тижні вагітності невідомі")
+            return []
+
+        inner = select(
+            bucket_expr.label('bucket'),
+            DailyRollup.count,
+            DailyRollup.total,
+            DailyRollup.min_value,
+            DailyRollup.max_value,
+            DailyRollup.last_value,
+            func.row_number().over(partition_by=bucket_expr, order_by=DailyRollup.day.desc()).label('rn'),
+        ).where(DailyRollup.user_id == user_id, DailyRollup.metric == metric)
+        if days:
+            inner = inner.where(DailyRollup.day >= date.today() - timedelta(days=days))
+        inner = inner.subquery()
+
+        count = func.sum(inner.c.count)
+        total = func.sum(inner.c.total)
+        stmt = select(
+            inner.c.bucket,
+            count,
+            total / count,
+            func.min(inner.c.min_value),
+            func.max(inner.c.max_value),
+            func.max(case((inner.c.rn == 1, inner.c.last_value))),
+            total,
+        ).group_by(inner.c.bucket).order_by(inner.c.bucket)
+
+        return [MetricStatsRow._make(row) for row in self.session.execute(stmt)]
+
+    def get_contraction_interval_stats(self, user_id=1, minutes=60):
+        """Статистика інтервалів між початками переймів (у секундах) за останні minutes хвилин"""
+        cutoff = datetime.now() - timedelta(minutes=minutes)
+        started_text = self._date_text(Contraction.date) + ' ' + self._time_text(Contraction.start_time, True)
+        started_at = cast(func.strftime('%s', started_text), Integer)
+        order = [Contraction.date, Contraction.start_time, Contraction.id]
+
+        inner = select(
+            started_at.label('started_at'),
+            func.lag(started_at).over(order_by=order).label('previous_started_at'),
+        ).where(Contraction.user_id == user_id, Contraction.date >= cutoff.date() - timedelta(days=1)).subquery()
+
+        # Враховуємо лише інтервали, що повністю лежать у вікні
+        cutoff_at = cast(func.strftime('%s', cutoff.strftime('%Y-%m-%d %H:%M:%S')), Integer)
+        window = inner.c.previous_started_at >= cutoff_at
+        interval = inner.c.started_at - inner.c.previous_started_at
+        last_started = select(func.max(inner.c.started_at)).where(window).scalar_subquery()
+
+        stmt = select(
+            func.count(interval),
+            func.avg(interval),
+            func.min(interval),
+            func.max(interval),
+            func.max(case((inner.c.started_at == last_started, interval))),
+            func.sum(interval),
+        ).where(window)
+
+        return MetricStatsRow(None, *self.session.execute(stmt).one())
+
+    def rebuild_rollups(self):
+        """Перераховує денні підсумки з сирих даних; повертає кількість рядків підсумків"""
+        self.flush_pending()
+        with self.engine.begin() as connection:
+            return rollups.rebuild(connection)
+
+    def verify_rollups(self):
+        """Список розбіжностей між денними підсумками та сирими даними (порожній, якщо все збігається)"""
+        self.flush_pending()
+        with self.engine.connect() as connection:
+            return rollups.verify(connection)
 
     def add_wishlist_item(self, title, description, category, price=None, priority=2, user_id=1):
         return self._add_record(WishlistItem, title=title, description=description,
@@ -204,11 +668,21 @@ class Database:
     def complete_reminder(self, reminder_id, user_id=1):
         return self._update_item(Reminder, reminder_id, user_id=user_id, is_completed=True)
 
+    def rollback(self):
+        """Відкочує сесію разом з усіма накопиченими груповими записами"""
+        self._pending_writes = 0
+        self._pending_since = None
+        self.session.rollback()
+
     def commit(self):
-        self.session.commit()
+        if self._pending_writes:
+            self.flush_pending()
+        else:
+            self.session.commit()
 
     def close(self):
-        self.session.close()
+        # Лише комітимо групу: сесія потоку спільна для всіх Database, її закриває release_thread_session
+        self.flush_pending()
 
     def add_calendar_event(self, title, description, start_date, start_time=None, end_time=None, event_type='regular',
                            user_id=1):
@@ -236,7 +710,8 @@ class Database:
             else:
                 end_time_obj = end_time
 
-        event = CalendarEvent(
+        return self._add_record(
+            CalendarEvent,
             user_id=user_id,
             title=title,
             description=description,
@@ -247,9 +722,6 @@ class Database:
             all_day=all_day,
             event_type=event_type
         )
-        self.session.add(event)
-        self.session.commit()
-        return event.id
 
     def get_events_for_date(self, date_str, user_id=1):
         date_obj = self._parse_date_time(date_str)
@@ -0,0 +1,150 @@
+"""Довідник розвитку дитини по тижнях, завантажений один раз за процес.
+
+JSON розбирається в список компактних записів WeekContent з доступом за номером тижня;
+рядки ваги та зросту одразу перетворюються на числа. Розібрані записи зберігаються
+в resources/cache у pickle з прив'язкою до розміру та часу зміни JSON, тож при
+наступних запусках розбір JSON пропускається, поки файл не зміниться.
+"""
+import json
+import os
+import pickle
+import re
+import threading
+from utils.logger import get_logger
+
+logger = get_logger('development_content')
+
+DATA_FILE = 'resources/data/baby_development.json'
+CACHE_FILE = 'resources/cache/baby_development.pickle'
+CACHE_VERSION = 1
+MAX_WEEK = 42
+
+_RANGE = re.compile(r'(\d+(?:[.,]\d+)?)(?:\s*[-–]\s*(\d+(?:[.,]\d+)?))?\s*([^\s\d]+)')
+# Множники до базових одиниць: вага в грамах, довжина в міліметрах
+_WEIGHT_UNITS = {'г': 1.0, 'кг': 1000.0}
+_LENGTH_UNITS = {'мм': 1.0, 'см': 10.0}
+
+
+def parse_measure(text, units):
+    """'1.1-1.2 кг' -> (1100.0, 1200.0); 'менше 1 г' -> (0.0, 1.0); (None, None), якщо не розпізнано"""
+    if not text:
+        return None, None
+    match = _RANGE.search(text)
+    if not match or match[3] not in units:
+        return None, None
+    factor = units[match[3]]
+    low = float(match[1].replace(',', '.')) * factor
+    high = float(match[2].replace(',', '.')) * factor if match[2] else low
+    if text.lstrip().lower().startswith('менше'):
+        low = 0.0
+    return low, high
+
+
+class WeekContent:
+    """Вміст одного тижня; відсутні в JSON тексти зберігаються як None"""
+    __slots__ = ('week', 'fruit', 'size_description', 'image', 'baby_development', 'boy_development',
+                 'girl_development', 'mother_changes', 'nutrition_tips', 'weight', 'length',
+                 'weight_min_g', 'weight_max_g', 'length_min_mm', 'length_max_mm')
+
+    def __init__(self, *values):
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+
+    def as_tuple(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    @classmethod
+    def from_json(cls, week, data):
+        size = data.get('size') or {}
+        weight = data.get('weight')
+        length = data.get('length')
+        return cls(week, size.get('fruit'), size.get('description'), data.get('image'),
+                   data.get('baby_development'), data.get('boy_development'), data.get('girl_development'),
+                   data.get('mother_changes'), data.get('nutrition_tips'), weight, length,
+                   *parse_measure(weight, _WEIGHT_UNITS), *parse_measure(length, _LENGTH_UNITS))
+
+
+class DevelopmentContent:
+    """Записи тижнів у списку, де індекс дорівнює номеру тижня (порожні місця — None)"""
+
+    def __init__(self, data_file=DATA_FILE, cache_file=CACHE_FILE):
+        self.data_file = data_file
+        self.cache_file = cache_file
+        self._weeks = [None] * (MAX_WEEK + 1)
+        self.available_weeks = ()
+        self.load()
+
+    def load(self):
+        try:
+            stat = os.stat(self.data_file)
+        except OSError as e:
+            logger.error(f"Помилка при завантаженні даних про розвиток дитини: {str(e)}")
+            return
+        source_key = (CACHE_VERSION, stat.st_size, stat.st_mtime_ns)
+        rows = self._read_cache(source_key)
+        if rows is None:
+            rows = self._parse_json()
+            if rows is None:
+                return
+            self._write_cache(source_key, rows)
+
+        weeks = [None] * (max([MAX_WEEK] + [row[0] for row in rows]) + 1)
+        for row in rows:
+            weeks[row[0]] = WeekContent(*row)
+        self._weeks = weeks
+        self.available_weeks = tuple(row[0] for row in sorted(rows))
+
+    def _parse_json(self):
+        try:
+            with open(self.data_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return [WeekContent.from_json(int(week), week_data).as_tuple()
+                    for week, week_data in data.get('weeks', {}).items()]
+        except (OSError, ValueError, AttributeError) as e:
+            logger.error(f"Помилка при завантаженні даних про розвиток дитини: {str(e)}")
+            return None
+
+    def _read_cache(self, source_key):
+        if not self.cache_file:
+            return None
+        try:
+            with open(self.cache_file, 'rb') as f:
+                cached_key, rows = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Кеш довідника розвитку пошкоджено, буде створено новий: {str(e)}")
+            return None
+        return rows if cached_key == source_key else None
+
+    def _write_cache(self, source_key, rows):
+        if not self.cache_file:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            temp_path = self.cache_file + '.tmp'
+            with open(temp_path, 'wb') as f:
+                pickle.dump((source_key, rows), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self.cache_file)
+        except OSError as e:
+            logger.warning(f"Не вдалося зберегти кеш довідника розвитку: {str(e)}")
+
+    def week(self, week):
+        """Запис тижня або None"""
+        if isinstance(week, int) and 0 <= week < len(self._weeks):
+            return self._weeks[week]
+        return None
+
+
+_development_content = None
+_development_content_lock = threading.Lock()
+
+
+def get_development_content():
+    """Повертає спільний для процесу довідник розвитку (завантажується при першому зверненні)"""
+    global _development_content
+    if _development_content is None:
+        with _development_content_lock:
+            if _development_content is None:
+                _development_content = DevelopmentContent()
+    return _development_content
@@ -0,0 +1,189 @@
+"""Заміри SQL-запитів через події рушія SQLAlchemy (вмикаються за потреби).
+
+Для кожного відбитка запиту (SQL без літералів) накопичуються кількість викликів, гістограма тривалості,
+кількість змінених рядків та методи Database, що його виконали. Повільні запити логуються одразу,
+зведена таблиця — при dispose_engines().
+
+Увімкнення: змінна середовища PREGNANCY_DB_QUERY_STATS=1, поріг повільного запиту — PREGNANCY_DB_SLOW_QUERY_MS.
+"""
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from sqlalchemy import event
+from utils.logger import get_logger
+
+logger = get_logger('query_stats')
+
+QUERY_STATS_ENV = 'PREGNANCY_DB_QUERY_STATS'
+SLOW_QUERY_ENV = 'PREGNANCY_DB_SLOW_QUERY_MS'
+DEFAULT_SLOW_QUERY_MS = 100.0
+
+# Верхні межі кошиків гістограми тривалості, мс
+HISTOGRAM_BOUNDS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, float('inf'))
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_PARAMETER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+_MAX_FINGERPRINTS = 5000
+
+
+def is_enabled():
+    return os.environ.get(QUERY_STATS_ENV, '').lower() in ('1', 'true', 'yes', 'on')
+
+
+def slow_query_ms():
+    try:
+        return float(os.environ.get(SLOW_QUERY_ENV, DEFAULT_SLOW_QUERY_MS))
+    except ValueError:
+        return DEFAULT_SLOW_QUERY_MS
+
+
+def fingerprint(statement):
+    """SQL без літералів і з однаковими списками параметрів: однакові запити дають однаковий відбиток"""
+    statement = _STRING_LITERAL.sub('?', statement)
+    statement = _NUMBER_LITERAL.sub('?', statement)
+    statement = _PARAMETER_LIST.sub('(?, ...)', statement)
+    return _WHITESPACE.sub(' ', statement).strip()
+
+
+def calling_method():
+    """Назва публічного методу Database, з якого (прямо чи через допоміжні методи) виконується запит"""
+    from .database import Database
+
+    frame = sys._getframe(1)
+    method = None
+    while frame is not None:
+        if isinstance(frame.f_locals.get('self'), Database):
+            method = frame.f_code.co_name
+        elif method is not None:
+            # Вийшли за межі Database: останній знайдений кадр і є викликаним методом
+            break
+        frame = frame.f_back
+    return method or '?'
+
+
+class _QueryEntry:
+    __slots__ = ('count', 'total_ms', 'max_ms', 'rows', 'histogram', 'methods')
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.histogram = [0] * len(HISTOGRAM_BOUNDS_MS)
+        self.methods = Counter()
+
+    def percentile_ms(self, fraction):
+        # Оцінка за гістограмою: верхня межа кошика, в який потрапляє потрібна частка викликів
+        target = fraction * self.count
+        seen = 0
+        for bound, hits in zip(HISTOGRAM_BOUNDS_MS, self.histogram):
+            seen += hits
+            if seen >= target:
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+
+class QueryStats:
+    """Накопичувач замірів запитів одного рушія"""
+
+    def __init__(self, slow_ms=None):
+        self.slow_ms = slow_query_ms() if slow_ms is None else slow_ms
+        self._entries = {}
+        self._fingerprints = {}
+        self._lock = threading.Lock()
+
+    def _fingerprint(self, statement):
+        # Рядки SQL від SQLAlchemy кешуються, тож нормалізація робиться раз на запит
+        result = self._fingerprints.get(statement)
+        if result is None:
+            if len(self._fingerprints) > _MAX_FINGERPRINTS:
+                self._fingerprints.clear()
+            result = self._fingerprints[statement] = fingerprint(statement)
+        return result
+
+    def record(self, statement, duration_ms, rows, method):
+        key = self._fingerprint(statement)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _QueryEntry()
+            entry.count += 1
+            entry.total_ms += duration_ms
+            entry.max_ms = max(entry.max_ms, duration_ms)
+            if rows > 0:
+                entry.rows += rows
+            entry.methods[method] += 1
+            for i, bound in enumerate(HISTOGRAM_BOUNDS_MS):
+                if duration_ms <= bound:
+                    entry.histogram[i] += 1
+                    break
+
+        if duration_ms >= self.slow_ms:
+            logger.warning(f"Повільний запит {duration_ms:.1f} мс у Database.{method}: {key[:300]}")
+
+    def summary(self):
+        """Рядки зведення, від найдорожчих за сумарним часом"""
+        with self._lock:
+            rows = [{
+                'fingerprint': key,
+                'count': e.count,
+                'total_ms': e.total_ms,
+                'avg_ms': e.total_ms / e.count,
+                'p50_ms': e.percentile_ms(0.50),
+                'p99_ms': e.percentile_ms(0.99),
+                'max_ms': e.max_ms,
+                'rows': e.rows,
+                'methods': dict(e.methods.most_common()),
+                'histogram': dict(zip(HISTOGRAM_BOUNDS_MS, e.histogram)),
+            } for key, e in self._entries.items()]
+        return sorted(rows, key=lambda r: r['total_ms'], reverse=True)
+
+    def reset(self):
+        with self._lock:
+            self._entries.clear()
+
+    def log_summary(self, limit=20):
+        rows = self.summary()
+        if not rows:
+            return
+        lines = [f"{'викл.':>7} {'сума мс':>10} {'сер. мс':>8} {'p50':>7} {'p99':>7} {'макс':>8} {'рядків':>8}  "
+                 f"{'метод':<28} запит"]
+        for r in rows[:limit]:
+            method = next(iter(r['methods']))
+            lines.append(f"{r['count']:>7} {r['total_ms']:>10.1f} {r['avg_ms']:>8.2f} {r['p50_ms']:>7.2f} "
+                         f"{r['p99_ms']:>7.2f} {r['max_ms']:>8.1f} {r['rows']:>8}  {method:<28} {r['fingerprint'][:120]}")
+        total_ms = sum(r['total_ms'] for r in rows)
+        logger.info(f"Зведення SQL-запитів ({len(rows)} різних, {total_ms:.0f} мс загалом):\n" + '\n'.join(lines))
+
+
+def instrument(engine, slow_ms=None):
+    """Підключає заміри до рушія; повертає накопичувач (повторний виклик повертає вже наявний)"""
+    stats = getattr(engine, 'query_stats', None)
+    if stats is not None:
+        return stats
+    stats = engine.query_stats = QueryStats(slow_ms)
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('query_started', []).append(time.perf_counter())
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        duration_ms = (time.perf_counter() - conn.info['query_started'].pop()) * 1000
+        # sqlite3 знає кількість рядків лише для змін; для SELECT rowcount дорівнює -1
+        stats.record(statement, duration_ms, cursor.rowcount, calling_method())
+
+    @event.listens_for(engine, 'handle_error')
+    def handle_error(exception_context):
+        # Після помилки after_cursor_execute не викликається: прибираємо незакритий замір
+        connection = exception_context.connection
+        if connection is not None and connection.info.get('query_started'):
+            connection.info['query_started'].pop()
+
+    logger.info(f"Увімкнено заміри SQL-запитів (поріг повільного запиту {stats.slow_ms:.0f} мс)")
+    return stats
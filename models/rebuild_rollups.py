@@ -0,0 +1,28 @@
+"""Перебудова денних підсумків трекерів з сирих даних та їх перевірка.
+
+Запуск: python -m models.rebuild_rollups [--db pregnancy_diary.db] [--verify-only]
+"""
+import argparse
+from .database import DEFAULT_DB_PATH, get_engine
+from .rollups import rebuild, verify
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Перебудова та перевірка денних підсумків трекерів')
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help='шлях до файлу бази даних')
+    parser.add_argument('--verify-only', action='store_true', help='лише перевірити, не перебудовуючи')
+    args = parser.parse_args()
+
+    with get_engine(args.db).begin() as connection:
+        if not args.verify_only:
+            print(f"Перебудовано рядків підсумків: {rebuild(connection)}")
+        mismatches = verify(connection)
+
+    for kind, row in mismatches:
+        print(kind, row)
+    print("Підсумки збігаються з сирими даними" if not mismatches else f"Розбіжностей: {len(mismatches)}")
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
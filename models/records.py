@@ -0,0 +1,13 @@
+from collections import namedtuple
+
+# Легкі рядки історії для читання без ORM: кортежі з доступом до полів за назвою
+WeightRow = namedtuple('WeightRow', ['id', 'date', 'weight'])
+BabyKickRow = namedtuple('BabyKickRow', ['id', 'date', 'time', 'count'])
+ContractionRow = namedtuple('ContractionRow', ['id', 'date', 'start_time', 'end_time', 'duration', 'intensity'])
+BloodPressureRow = namedtuple('BloodPressureRow', ['id', 'date', 'time', 'systolic', 'diastolic', 'pulse', 'notes'])
+BellyMeasurementRow = namedtuple('BellyMeasurementRow', ['id', 'date', 'measurement', 'notes'])
+HealthNoteRow = namedtuple('HealthNoteRow', ['id', 'date', 'content', 'title'])
+
+# Підсумок показника за один період (день, тиждень або тиждень вагітності); total — сума значень,
+# наприклад кількість поштовхів за день
+MetricStatsRow = namedtuple('MetricStatsRow', ['bucket', 'count', 'avg', 'min', 'max', 'last', 'total'])
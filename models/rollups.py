@@ -0,0 +1,130 @@
+"""Денні підсумки (rollups) показників трекерів.
+
+Таблиця daily_rollups зберігає для кожного користувача, дня та показника кількість,
+суму, мінімум, максимум та останнє значення. Її підтримують тригери SQLite на таблицях
+трекерів, тож підсумки оновлюються при будь-якій вставці, зміні чи видаленні,
+зокрема й при пакетних Core-вставках.
+
+Перебудова та перевірка: python -m models.rebuild_rollups [--db pregnancy_diary.db] [--verify-only]
+"""
+from sqlalchemy import text
+from .base import DailyRollup, TRACKER_METRICS
+
+ROLLUP_TABLE = DailyRollup.__tablename__
+ROLLUP_COLUMNS = 'user_id, day, metric, count, total, min_value, max_value, last_value, last_time, last_id'
+
+
+def _metrics_by_table():
+    tables = {}
+    for metric, (model_class, value_name, time_name) in TRACKER_METRICS.items():
+        tables.setdefault(model_class.__tablename__, []).append((metric, value_name, time_name))
+    return tables
+
+
+def _time_expr(time_name, prefix=''):
+    return f"coalesce({prefix}{time_name}, '')" if time_name else "''"
+
+
+def _recompute_day_sql(table, metric, value_name, time_name, row):
+    """Перераховує підсумок одного дня з сирих даних (для змін і видалень)"""
+    return f"""
+        DELETE FROM {ROLLUP_TABLE} WHERE user_id = {row}.user_id AND day = {row}.date AND metric = '{metric}';
+        INSERT INTO {ROLLUP_TABLE} ({ROLLUP_COLUMNS})
+        {_aggregate_sql(table, metric, value_name, time_name, f"g.user_id = {row}.user_id AND g.date = {row}.date")};"""
+
+
+def _insert_sql(metric, value_name, time_name):
+    """Інкрементально додає новий запис до підсумку його дня"""
+    new_time = _time_expr(time_name, 'NEW.')
+    newer = "(excluded.last_time, excluded.last_id) > (last_time, last_id)"
+    return f"""
+        INSERT INTO {ROLLUP_TABLE} ({ROLLUP_COLUMNS})
+        SELECT NEW.user_id, NEW.date, '{metric}', 1, NEW.{value_name}, NEW.{value_name}, NEW.{value_name},
+               NEW.{value_name}, {new_time}, NEW.id
+        WHERE NEW.{value_name} IS NOT NULL
+        ON CONFLICT (user_id, day, metric) DO UPDATE SET
+            count = count + 1,
+            total = total + excluded.total,
+            min_value = min(min_value, excluded.min_value),
+            max_value = max(max_value, excluded.max_value),
+            last_value = CASE WHEN {newer} THEN excluded.last_value ELSE last_value END,
+            last_time = CASE WHEN {newer} THEN excluded.last_time ELSE last_time END,
+            last_id = CASE WHEN {newer} THEN excluded.last_id ELSE last_id END;"""
+
+
+def trigger_statements():
+    """CREATE TRIGGER для кожної таблиці трекера: вставка, зміна та видалення"""
+    statements = []
+    for table, metrics in _metrics_by_table().items():
+        inserts = ''.join(_insert_sql(*m) for m in metrics)
+        deletes = ''.join(_recompute_day_sql(table, *m, 'OLD') for m in metrics)
+        updates = deletes + ''.join(_recompute_day_sql(table, *m, 'NEW') for m in metrics)
+        statements.append(f"""CREATE TRIGGER IF NOT EXISTS {table}_rollup_insert AFTER INSERT ON {table}
+            WHEN NEW.date IS NOT NULL BEGIN {inserts}
+            END""")
+        statements.append(f"""CREATE TRIGGER IF NOT EXISTS {table}_rollup_delete AFTER DELETE ON {table}
+            WHEN OLD.date IS NOT NULL BEGIN {deletes}
+            END""")
+        statements.append(f"""CREATE TRIGGER IF NOT EXISTS {table}_rollup_update AFTER UPDATE ON {table}
+            BEGIN {updates}
+            END""")
+    return statements
+
+
+def _aggregate_sql(table, metric, value_name, time_name, condition='1'):
+    # Останнє значення дня шукаємо корельованим підзапитом по індексу (user_id, date, ...):
+    # це в рази дешевше за віконну функцію по всій таблиці
+    time_expr = _time_expr(time_name, 'r.')
+    return f"""
+        SELECT a.user_id, a.day, '{metric}' AS metric, a.count, a.total, a.min_value, a.max_value,
+               l.{value_name} AS last_value, {_time_expr(time_name, 'l.')} AS last_time, l.id AS last_id
+        FROM (SELECT user_id, date AS day, count({value_name}) AS count, sum({value_name}) AS total,
+                     min({value_name}) AS min_value, max({value_name}) AS max_value,
+                     (SELECT id FROM {table} AS r
+                      WHERE r.user_id = g.user_id AND r.date = g.date AND r.{value_name} IS NOT NULL
+                      ORDER BY {time_expr} DESC, r.id DESC LIMIT 1) AS last_id
+              FROM {table} AS g
+              WHERE g.date IS NOT NULL AND g.{value_name} IS NOT NULL AND {condition}
+              GROUP BY user_id, date) AS a
+        JOIN {table} AS l ON l.id = a.last_id"""
+
+
+def _all_aggregates_sql():
+    return ' UNION ALL '.join(_aggregate_sql(table, *m)
+                              for table, metrics in _metrics_by_table().items() for m in metrics)
+
+
+def install_triggers(connection):
+    """Створює відсутні тригери; повертає True, якщо їх довелося створювати"""
+    existing = {row[0] for row in connection.execute(
+        text("SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE '%_rollup_%'"))}
+    statements = trigger_statements()
+    missing = [s for s in statements if s.split()[5] not in existing]
+    for statement in missing:
+        connection.execute(text(statement))
+    return bool(missing)
+
+
+def drop_triggers(connection):
+    """Прибирає тригери підсумків (для масового завантаження; після нього — install_triggers та rebuild)"""
+    for statement in trigger_statements():
+        connection.execute(text(f"DROP TRIGGER IF EXISTS {statement.split()[5]}"))
+
+
+def rebuild(connection):
+    """Повністю перераховує підсумки з сирих даних; повертає кількість рядків підсумків"""
+    connection.execute(text(f"DELETE FROM {ROLLUP_TABLE}"))
+    result = connection.execute(text(f"INSERT INTO {ROLLUP_TABLE} ({ROLLUP_COLUMNS}) {_all_aggregates_sql()}"))
+    return result.rowcount
+
+
+def verify(connection):
+    """Порівнює підсумки з агрегацією сирих даних; повертає розбіжні рядки (порожній список, якщо все збігається)"""
+    # Суму округлюємо: інкрементне додавання дробових значень може розійтися з sum() в останніх знаках
+    columns = 'user_id, day, metric, count, round(total, 6), min_value, max_value, last_value'
+    expected = f"SELECT {columns} FROM ({_all_aggregates_sql()})"
+    stored = f"SELECT {columns} FROM {ROLLUP_TABLE}"
+    missing = connection.execute(text(f"{expected} EXCEPT {stored}")).all()
+    unexpected = connection.execute(text(f"{stored} EXCEPT {expected}")).all()
+    return [('missing', tuple(row)) for row in missing] + [('unexpected', tuple(row)) for row in unexpected]
+
@@ -0,0 +1,185 @@
+from PyQt6.QtCore import QObject, QThread, QMetaObject, QTimer, Qt, pyqtSignal, pyqtSlot
+from sqlalchemy.exc import SQLAlchemyError
+from models.database import Database, DEFAULT_DB_PATH, release_thread_session
+from utils.logger import get_logger
+
+logger = get_logger('db_worker')
+
+
+class _DatabaseWorker(QObject):
+    """Виконує методи Database у фоновому потоці з власною сесією"""
+    finished = pyqtSignal(int, object, object)
+
+    def __init__(self, db_path):
+        super().__init__()
+        self.db = Database(db_path)
+        # Запити, чиї записи чекають на спільний груповий commit
+        self._waiting = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self.flush)
+
+    @pyqtSlot(int, str, object, object)
+    def execute(self, request_id, method_name, args, kwargs):
+        try:
+            result = getattr(self.db, method_name)(*args, **kwargs)
+        except Exception as e:
+            logger.error(f"Помилка фонового запису {method_name}: {str(e)}")
+            if isinstance(e, SQLAlchemyError) or not self.db.session.is_active or not self.db.pending_writes:
+                # Помилка бази (або невдалий flush/commit) зіпсувала транзакцію разом з накопиченою
+                # групою: відкочуємо сесію, щоб наступні записи не падали, і повідомляємо про втрату групи
+                self._flush_timer.stop()
+                self.db.rollback()
+                self._fail_waiting(str(e))
+            self.finished.emit(request_id, None, str(e))
+            return
+
+        if self.db.pending_writes:
+            self._waiting.append((request_id, result))
+            if not self._flush_timer.isActive():
+                remaining = self.db.group_commit_window - self.db.pending_age()
+                self._flush_timer.start(max(0, int(remaining * 1000)))
+        else:
+            self._emit_waiting()
+            self.finished.emit(request_id, result, None)
+
+    @pyqtSlot()
+    def flush(self):
+        self._flush_timer.stop()
+        try:
+            self.db.flush_pending()
+        except Exception as e:
+            logger.error(f"Помилка групового коміту: {str(e)}")
+            self._fail_waiting(str(e))
+            return
+        self._emit_waiting()
+
+    @pyqtSlot(object, int)
+    def set_group_commit(self, window, max_batch):
+        if window is None:
+            self.flush()
+            self.db.disable_group_commit()
+        else:
+            self.db.enable_group_commit(window, max_batch)
+
+    @pyqtSlot()
+    def drain(self):
+        # Викликається блокуюче: до цього моменту всі попередні команди вже виконані
+        self.flush()
+
+    def _emit_waiting(self):
+        waiting, self._waiting = self._waiting, []
+        for request_id, result in waiting:
+            self.finished.emit(request_id, result, None)
+
+    def _fail_waiting(self, error):
+        waiting, self._waiting = self._waiting, []
+        for request_id, _ in waiting:
+            self.finished.emit(request_id, None, error)
+
+    def close(self):
+        # Викликається в самому фоновому потоці при його завершенні
+        self.db.close()
+        release_thread_session(self.db.db_path)
+
+
+class DatabaseWriteQueue(QObject):
+    """Черга записів у базу, що комітить їх поза потоком інтерфейсу"""
+    write_finished = pyqtSignal(int, object)
+    write_failed = pyqtSignal(int, str)
+    _submit = pyqtSignal(int, str, object, object)
+    _flush = pyqtSignal()
+    _set_group_commit = pyqtSignal(object, int)
+
+    def __init__(self, db_path=DEFAULT_DB_PATH, parent=None):
+        super().__init__(parent)
+        self._next_id = 0
+        self._callbacks = {}
+
+        self.thread = QThread()
+        self.worker = _DatabaseWorker(db_path)
+        self.worker.moveToThread(self.thread)
+
+        self._submit.connect(self.worker.execute)
+        self._flush.connect(self.worker.flush)
+        self._set_group_commit.connect(self.worker.set_group_commit)
+        self.worker.finished.connect(self._on_finished)
+        # Сесію потоку закриваємо в ньому ж, перед його завершенням
+        self.thread.finished.connect(self.worker.close, Qt.ConnectionType.DirectConnection)
+        self.thread.start()
+        logger.info("Фоновий потік запису в базу запущено")
+
+    def submit(self, method_name, *args, callback=None, **kwargs):
+        """Ставить виклик Database.<method_name> у чергу; callback(result, error) виконується в потоці GUI"""
+        self._next_id += 1
+        request_id = self._next_id
+        if callback:
+            self._callbacks[request_id] = callback
+        self._submit.emit(request_id, method_name, args, kwargs)
+        return request_id
+
+    def enable_group_commit(self, window=0.25, max_batch=50):
+        """Вмикає групові коміти для частих дрібних записів (лічильники переймів і поштовхів)"""
+        self._set_group_commit.emit(window, max_batch)
+
+    def disable_group_commit(self):
+        """Комітить накопичене та повертає звичайний режим: commit на кожен запис"""
+        self._set_group_commit.emit(None, 0)
+
+    def flush(self):
+        self._flush.emit()
+
+    def get_group_commit_stats(self):
+        """Лічильники групових комітів: кількість пакетів, розміри та час flush"""
+        return self.worker.db.get_group_commit_stats()
+
+    def wait_idle(self):
+        """Блокує до завершення всіх поставлених у чергу записів"""
+        if self.thread.isRunning():
+            QMetaObject.invokeMethod(self.worker, 'drain', Qt.ConnectionType.BlockingQueuedConnection)
+
+    def stop(self):
+        self.wait_idle()
+        self.thread.quit()
+        self.thread.wait()
+        stats = self.get_group_commit_stats()
+        if stats['batches']:
+            logger.info(f"Групові коміти: {stats['batches']} пакетів, у середньому {stats['avg_batch']:.1f} записів, "
+                        f"flush {stats['avg_flush_ms']:.1f} мс (макс. {stats['max_flush_ms']:.1f} мс)")
+        logger.info("Фоновий потік запису в базу зупинено")
+
+    def _on_finished(self, request_id, result, error):
+        global _write_generation
+        callback = self._callbacks.pop(request_id, None)
+        if error is None:
+            _write_generation += 1
+            self.write_finished.emit(request_id, result)
+        else:
+            self.write_failed.emit(request_id, error)
+        if callback:
+            callback(result, error)
+
+
+_write_queue = None
+# Кількість успішних фонових записів за час роботи процесу; не скидається при зупинці черги
+_write_generation = 0
+
+
+def get_write_queue(create=True):
+    """Повертає спільну для процесу чергу фонових записів; з create=False — None, якщо черги немає або її зупинено"""
+    global _write_queue
+    if _write_queue is None and create:
+        _write_queue = DatabaseWriteQueue()
+    return _write_queue
+
+
+def write_generation():
+    """Лічильник успішних записів: якщо він не змінився, дані в базі з того часу не змінювались через чергу"""
+    return _write_generation
+
+
+def stop_write_queue():
+    global _write_queue
+    if _write_queue is not None:
+        _write_queue.stop()
+        _write_queue = None
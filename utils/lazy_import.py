@@ -0,0 +1,40 @@
+"""Відкладений імпорт важких залежностей (reportlab тощо).
+
+Модуль імпортується при першому зверненні до його атрибута, а не під час запуску додатку:
+
+    platypus = lazy_module('reportlab.platypus')
+    ...
+    platypus.SimpleDocTemplate(...)  # тут reportlab і завантажується
+"""
+import importlib
+import time
+from utils.logger import get_logger
+
+logger = get_logger('lazy_import')
+
+
+class LazyModule:
+    __slots__ = ('_name', '_module')
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            started = time.perf_counter()
+            self._module = importlib.import_module(self._name)
+            logger.info(f"Завантажено модуль {self._name} за {(time.perf_counter() - started) * 1000:.0f} мс")
+        return self._module
+
+    def __getattr__(self, name):
+        return getattr(self._load(), name)
+
+    def __repr__(self):
+        state = 'завантажено' if self._module is not None else 'не завантажено'
+        return f"<LazyModule {self._name} ({state})>"
+
+
+def lazy_module(name):
+    """Повертає заступник модуля, що імпортує його при першому зверненні до атрибута"""
+    return LazyModule(name)
@@ -0,0 +1,64 @@
+from collections import OrderedDict
+from utils.logger import get_logger
+
+logger = get_logger('pixmap_cache')
+
+
+def pixmap_bytes(pixmap):
+    """Приблизний обсяг пам'яті, який займає QPixmap"""
+    return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+
+class PixmapCache:
+    """LRU-кеш QPixmap з обмеженням за сумарним обсягом у байтах"""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._items = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key):
+        pixmap = self._items.get(key)
+        if pixmap is None:
+            self.misses += 1
+            return None
+        self._items.move_to_end(key)
+        self.hits += 1
+        return pixmap
+
+    def put(self, key, pixmap):
+        size = pixmap_bytes(pixmap)
+        if size > self.max_bytes:
+            return
+        old = self._items.pop(key, None)
+        if old is not None:
+            self._bytes -= pixmap_bytes(old)
+        self._items[key] = pixmap
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            _, evicted = self._items.popitem(last=False)
+            self._bytes -= pixmap_bytes(evicted)
+            self.evictions += 1
+
+    def clear(self):
+        self._items.clear()
+        self._bytes = 0
+
+    def get_stats(self):
+        return {
+            'items': len(self._items),
+            'bytes': self._bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
@@ -0,0 +1,89 @@
+"""Індекс файлів resources/images, побудований одним обходом теки за процес.
+
+Замість перебору можливих назв та os.path.exists при кожному показі тижня екран
+отримує шлях до зображення зі словника тиждень -> файл. Індекс не залежить від Qt;
+відстеження змін у режимі розробки — views/weeks/resource_watcher.py.
+"""
+import os
+import re
+from utils.logger import get_logger
+
+logger = get_logger('resource_index')
+
+IMAGES_DIR = 'resources/images'
+FRUITS_DIR = 'resources/images/fruits'
+
+# Порядок важливий: якщо для тижня є кілька файлів, береться перший за префіксом, потім за розширенням
+_WEEK_PREFIXES = ('', 'week', 'week_', 'тиждень', 'тиждень_')
+_WEEK_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+_WEEK_FILE = re.compile(r'^(week_?|тиждень_?)?(\d+)(\.png|\.jpe?g)$', re.IGNORECASE)
+
+
+def _normalize(path):
+    return os.path.normpath(path)
+
+
+class ResourceIndex:
+    """Знімок файлів теки ресурсів і відповідність тиждень -> зображення фрукта"""
+
+    def __init__(self, root=IMAGES_DIR, fruits_dir=FRUITS_DIR):
+        self.root = root
+        self.fruits_dir = fruits_dir
+        self._files = frozenset()
+        self._week_images = {}
+        self.directories = []
+        self.scan()
+
+    def scan(self):
+        files = set()
+        directories = []
+        for directory, _, names in os.walk(self.root):
+            directories.append(directory)
+            files.update(_normalize(os.path.join(directory, name)) for name in names)
+
+        week_images = {}
+        ranks = {}
+        fruits_dir = _normalize(self.fruits_dir)
+        for path in files:
+            directory, name = os.path.split(path)
+            match = _WEEK_FILE.match(name)
+            if directory != fruits_dir or not match:
+                continue
+            week = int(match[2])
+            rank = (_WEEK_PREFIXES.index((match[1] or '').lower()), _WEEK_EXTENSIONS.index(match[3].lower()))
+            if week not in ranks or rank < ranks[week]:
+                ranks[week] = rank
+                week_images[week] = f"{self.fruits_dir}/{name}"
+
+        # Заміна цілих об'єктів: фонові потоки, що читають індекс, бачать або старий, або новий знімок
+        self._files = frozenset(files)
+        self._week_images = week_images
+        self.directories = directories
+        logger.info(f"Проіндексовано {len(files)} файлів ресурсів, зображень тижнів: {len(week_images)}")
+
+    def exists(self, path):
+        """Чи є файл у знімку; шляхи поза текою ресурсів перевіряються на диску"""
+        normalized = _normalize(path)
+        if normalized.startswith(_normalize(self.root) + os.sep):
+            return normalized in self._files
+        return os.path.exists(path)
+
+    def week_image(self, week, image_hint=None):
+        """Шлях до зображення тижня (спершу вказаний у даних, якщо такий файл є) або None"""
+        if image_hint and self.exists(image_hint):
+            return image_hint
+        return self._week_images.get(week)
+
+    def week_image_paths(self):
+        return list(self._week_images.values())
+
+
+_resource_index = None
+
+
+def get_resource_index():
+    """Повертає спільний для процесу індекс ресурсів (будується при першому зверненні)"""
+    global _resource_index
+    if _resource_index is None:
+        _resource_index = ResourceIndex()
+    return _resource_index
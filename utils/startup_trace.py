@@ -0,0 +1,197 @@
+"""Трасування запуску додатку: вкладені проміжки з часом виконання та процесорним часом.
+
+Імпорти модулів, конструктори екранів, відновлення сесії та створення контролерів записуються
+в дерево, яке логується після першого відмальовування вікна. Якщо задана змінна середовища
+PREGNANCY_STARTUP_TRACE=<файл.json>, дерево також зберігається у форматі Chrome trace events
+(відкривається в chrome://tracing або Perfetto). PREGNANCY_STARTUP_TRACE_OFF=1 вимикає
+трасування повністю (наприклад, для аудиту імпортів, де хук імпортів спотворював би заміри).
+"""
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from importlib.abc import MetaPathFinder
+from utils.logger import get_logger
+
+logger = get_logger('startup_trace')
+
+TRACE_FILE_ENV = 'PREGNANCY_STARTUP_TRACE'
+TRACE_OFF_ENV = 'PREGNANCY_STARTUP_TRACE_OFF'
+# Проміжки, коротші за поріг, у лог не виводяться (у JSON потрапляють усі)
+MIN_LOG_MS = 2.0
+# Модулі з цієї теки — власний код додатку; імпорти бібліотек у лозі показуються без вкладених
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Span:
+    __slots__ = ('name', 'category', 'wall_start', 'wall_end', 'cpu_start', 'cpu_end', 'children')
+
+    def __init__(self, name, category):
+        self.name = name
+        self.category = category
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.thread_time()
+        self.wall_end = None
+        self.cpu_end = None
+        self.children = []
+
+    def close(self):
+        self.wall_end = time.perf_counter()
+        self.cpu_end = time.thread_time()
+
+    @property
+    def wall_ms(self):
+        return ((self.wall_end or time.perf_counter()) - self.wall_start) * 1000
+
+    @property
+    def cpu_ms(self):
+        return ((self.cpu_end or time.thread_time()) - self.cpu_start) * 1000
+
+
+class _TracedLoader:
+    """Обгортка завантажувача модуля: виконання модуля записується як проміжок 'import'"""
+
+    def __init__(self, loader, tracer):
+        self._loader = loader
+        self._tracer = tracer
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        path = getattr(module, '__file__', None) or ''
+        category = 'import' if path.startswith(APP_DIR) else 'library'
+        with self._tracer.span(module.__name__, category):
+            self._loader.exec_module(module)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class _ImportTracer(MetaPathFinder):
+    """Перехоплює пошук модулів і обгортає їхні завантажувачі, як -X importtime"""
+
+    def __init__(self, tracer):
+        self._tracer = tracer
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                    spec.loader = _TracedLoader(spec.loader, self._tracer)
+                return spec
+        return None
+
+
+class StartupTracer:
+    def __init__(self):
+        self.root = None
+        self._stack = []
+        self._import_hook = None
+        self._thread = None
+
+    @property
+    def active(self):
+        return self.root is not None and self.root.wall_end is None
+
+    def start(self, name='Запуск додатку'):
+        """Починає трасування в поточному потоці та вмикає запис імпортів"""
+        if self.root is not None or os.environ.get(TRACE_OFF_ENV, '').lower() in ('1', 'true', 'yes', 'on'):
+            return
+        self._thread = threading.get_ident()
+        self.root = Span(name, 'startup')
+        self._stack = [self.root]
+        self._import_hook = _ImportTracer(self)
+        sys.meta_path.insert(0, self._import_hook)
+
+    def begin(self, name, category='startup'):
+        """Відкриває проміжок без контекстного менеджера; його закриє finish()"""
+        # Поза запуском і в інших потоках трасування нічого не коштує
+        if not self.active or threading.get_ident() != self._thread:
+            return None
+        span = Span(name, category)
+        self._stack[-1].children.append(span)
+        self._stack.append(span)
+        return span
+
+    @contextmanager
+    def span(self, name, category='startup'):
+        span = self.begin(name, category)
+        if span is None:
+            yield
+            return
+        try:
+            yield
+        finally:
+            span.close()
+            self._stack.pop()
+
+    def traced(self, name=None, category='startup'):
+        """Декоратор: виклик функції записується як проміжок"""
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(name or func.__qualname__, category):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def finish(self):
+        """Закриває трасування (після першого відмальовування), логує дерево та за потреби пише JSON"""
+        if not self.active:
+            return
+        if self._import_hook in sys.meta_path:
+            sys.meta_path.remove(self._import_hook)
+        self._import_hook = None
+        while self._stack:
+            self._stack.pop().close()
+
+        logger.info("Час запуску:\n" + '\n'.join(self._format(self.root)))
+        path = os.environ.get(TRACE_FILE_ENV)
+        if path:
+            try:
+                self.write_chrome_trace(path)
+                logger.info(f"Трасу запуску збережено у {path}")
+            except OSError as e:
+                logger.error(f"Не вдалося зберегти трасу запуску: {str(e)}")
+
+    def _format(self, span, depth=0):
+        lines = [f"{'  ' * depth}{span.name}: {span.wall_ms:.1f} мс (CPU {span.cpu_ms:.1f} мс)"]
+        if span.category == 'library':
+            return lines
+        hidden = 0
+        for child in span.children:
+            if child.wall_ms >= MIN_LOG_MS:
+                lines.extend(self._format(child, depth + 1))
+            else:
+                hidden += 1
+        if hidden:
+            lines.append(f"{'  ' * (depth + 1)}… ще {hidden} коротших за {MIN_LOG_MS:.0f} мс")
+        return lines
+
+    def write_chrome_trace(self, path):
+        events = []
+        origin = self.root.wall_start
+
+        def collect(span):
+            events.append({
+                'name': span.name, 'cat': span.category, 'ph': 'X', 'pid': os.getpid(), 'tid': self._thread,
+                'ts': (span.wall_start - origin) * 1e6, 'dur': span.wall_ms * 1000,
+                'args': {'cpu_ms': round(span.cpu_ms, 3)},
+            })
+            for child in span.children:
+                collect(child)
+
+        collect(self.root)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f, ensure_ascii=False)
+
+
+# Один трасувальник на процес
+startup_trace = StartupTracer()
@@ -0,0 +1,208 @@
+"""Мініатюри зображень фруктів: зменшені та обрізані по колу, для 1x та 2x DPR.
+
+Вихідні PNG важать мегабайти, а на екрані тижнів показується коло 180 px. Мініатюри
+зберігаються у resources/cache/thumbnails під назвою з хешу вмісту вихідного файлу;
+manifest.json пам'ятає розмір, час зміни та хеш кожного джерела, тож при запуску
+достатньо stat() (один раз за процес), а перерахунок хешу й перебудова відбуваються
+лише для змінених файлів.
+
+Попередня збірка: python -m utils.thumbnails [--source resources/images/fruits] [--force]
+"""
+import argparse
+import hashlib
+import json
+import os
+import threading
+from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtGui import QImage, QImageReader, QPainter, QPainterPath
+from utils.logger import get_logger
+
+logger = get_logger('thumbnails')
+
+SOURCE_DIR = 'resources/images/fruits'
+CACHE_DIR = 'resources/cache/thumbnails'
+THUMBNAIL_SIZE = 180
+SCALES = (1, 2)
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+MANIFEST_VERSION = 1
+
+
+def file_hash(path):
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def render_circular(source_path, size):
+    """Декодує зображення одразу в потрібному розмірі та обрізає по колу; повертає QImage або None"""
+    reader = QImageReader(source_path)
+    reader.setAutoTransform(True)
+    source_size = reader.size()
+    if source_size.isValid():
+        # Як KeepAspectRatioByExpanding: менша сторона дорівнює розміру кола
+        reader.setScaledSize(source_size.scaled(QSize(size, size), Qt.AspectRatioMode.KeepAspectRatioByExpanding))
+    image = reader.read()
+    if image.isNull():
+        logger.error(f"Не вдалося декодувати {source_path}: {reader.errorString()}")
+        return None
+
+    result = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+    result.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(result)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+    path = QPainterPath()
+    path.addEllipse(0, 0, size, size)
+    painter.setClipPath(path)
+    painter.drawImage((size - image.width()) // 2, (size - image.height()) // 2, image)
+    painter.end()
+    return result
+
+
+class ThumbnailCache:
+    """Мініатюри на диску, прив'язані до хешу вмісту джерела"""
+
+    def __init__(self, cache_dir=CACHE_DIR, size=THUMBNAIL_SIZE):
+        self.cache_dir = cache_dir
+        self.size = size
+        self._manifest_path = os.path.join(cache_dir, 'manifest.json')
+        self._sources = self._load_manifest()
+        # (джерело, масштаб) -> вже перевірена мініатюра: повторні звернення не торкаються диска
+        self._resolved = {}
+        self._lock = threading.Lock()
+
+    def _load_manifest(self):
+        try:
+            with open(self._manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('version') == MANIFEST_VERSION and manifest.get('size') == self.size:
+                return manifest.get('sources', {})
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Маніфест мініатюр пошкоджено, буде створено новий: {str(e)}")
+        return {}
+
+    def _save_manifest(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temp_path = self._manifest_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_VERSION, 'size': self.size, 'sources': self._sources},
+                      f, ensure_ascii=False, indent=1)
+        os.replace(temp_path, self._manifest_path)
+
+    def _thumbnail_file(self, content_hash, scale):
+        return os.path.join(self.cache_dir, f"{content_hash[:20]}@{scale}x.png")
+
+    def _content_hash(self, source_path):
+        """Хеш джерела з маніфесту, якщо файл не змінювався (за розміром і часом зміни), інакше — перерахований"""
+        stat = os.stat(source_path)
+        key = os.path.normpath(source_path)
+        entry = self._sources.get(key)
+        if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            return entry['hash'], False
+        content_hash = file_hash(source_path)
+        self._sources[key] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'hash': content_hash}
+        return content_hash, True
+
+    def _build(self, source_path, content_hash, scale):
+        target = self._thumbnail_file(content_hash, scale)
+        image = render_circular(source_path, self.size * scale)
+        if image is None:
+            return None
+        temp_path = target + '.tmp.png'
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            if not image.save(temp_path, 'PNG'):
+                logger.error(f"Не вдалося зберегти мініатюру {target}")
+                return None
+            os.replace(temp_path, target)
+        except OSError as e:
+            # Тека кешу недоступна для запису: викликач декодує оригінал напряму
+            logger.error(f"Не вдалося зберегти мініатюру {target}: {str(e)}")
+            return None
+        logger.info(f"Створено мініатюру {target} для {source_path}")
+        return target
+
+    def get(self, source_path, scale=1, force=False):
+        """Шлях до мініатюри джерела для масштабу scale; за потреби будує її. None, якщо не вдалося"""
+        scale = 2 if scale > 1 else 1
+        resolved_key = (os.path.normpath(source_path), scale)
+        if not force:
+            target = self._resolved.get(resolved_key)
+            if target is not None:
+                return target
+        with self._lock:
+            try:
+                content_hash, changed = self._content_hash(source_path)
+            except OSError as e:
+                logger.error(f"Не вдалося прочитати {source_path}: {str(e)}")
+                return None
+            target = self._thumbnail_file(content_hash, scale)
+            if force or not os.path.exists(target):
+                target = self._build(source_path, content_hash, scale)
+            if changed:
+                try:
+                    self._save_manifest()
+                except OSError as e:
+                    logger.warning(f"Не вдалося зберегти маніфест мініатюр: {str(e)}")
+            if target is not None:
+                self._resolved[resolved_key] = target
+            return target
+
+    def forget(self):
+        """Забуває перевірені мініатюри: наступне звернення знову звірить джерела з маніфестом"""
+        self._resolved.clear()
+
+    def build_all(self, source_dir=SOURCE_DIR, force=False):
+        """Будує мініатюри для всіх зображень теки; повертає (кількість джерел, кількість невдач)"""
+        sources = sorted(name for name in os.listdir(source_dir) if name.lower().endswith(IMAGE_EXTENSIONS))
+        failed = 0
+        for name in sources:
+            for scale in SCALES:
+                if self.get(os.path.join(source_dir, name), scale, force=force) is None:
+                    failed += 1
+        self.prune()
+        return len(sources), failed
+
+    def prune(self):
+        """Видаляє мініатюри, на які більше не посилається жодне джерело"""
+        with self._lock:
+            live = {self._thumbnail_file(entry['hash'], scale)
+                    for entry in self._sources.values() for scale in SCALES}
+            removed = 0
+            for name in os.listdir(self.cache_dir) if os.path.isdir(self.cache_dir) else []:
+                path = os.path.join(self.cache_dir, name)
+                if name.endswith('.png') and path not in live:
+                    os.remove(path)
+                    removed += 1
+            return removed
+
+
+_thumbnail_cache = None
+
+
+def get_thumbnail_cache():
+    """Повертає спільний для процесу кеш мініатюр"""
+    global _thumbnail_cache
+    if _thumbnail_cache is None:
+        _thumbnail_cache = ThumbnailCache()
+    return _thumbnail_cache
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Попередня збірка мініатюр зображень фруктів')
+    parser.add_argument('--source', default=SOURCE_DIR, help='тека з вихідними зображеннями')
+    parser.add_argument('--force', action='store_true', help='перебудувати навіть актуальні мініатюри')
+    args = parser.parse_args()
+
+    cache = get_thumbnail_cache()
+    total, failed = cache.build_all(args.source, force=args.force)
+    print(f"Мініатюр для {total} зображень у {cache.cache_dir}, невдач: {failed}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -93,7 +93,7 @@ class ChildInfoEditor(QWidget):
         logger.info("Завантажено дані про дитину")
 
     def save_child_data(self):
-        if not self.data_controller or not self.data_controller.pregnancy_data:
+        if not self.data_controller or not self.data_controller.ensure_pregnancy_data():
             QMessageBox.warning(self, "Помилка", "Неможливо зберегти дані про дитину - користувач не авторизований")
             return
 
@@ -296,7 +296,7 @@ class PregnancyEditor(QWidget):
             self.days_left_label.setText("До пологів: не визначено")
 
     def save_pregnancy_data(self):
-        if not self.data_controller or not self.data_controller.pregnancy_data:
+        if not self.data_controller or not self.data_controller.ensure_pregnancy_data():
             QMessageBox.warning(self, "Помилка", "Неможливо зберегти дані - користувач не авторизований")
             return
 
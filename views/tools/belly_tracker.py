@@ -1,6 +1,7 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QMessageBox, QSplitter, QFormLayout
 from PyQt6.QtCore import Qt, QDate
 from controllers.data_controller import DataController
+from utils.db_worker import get_write_queue
 from utils.logger import get_logger
 from utils.base_widgets import (StyledCard, StyledDateEdit, StyledDoubleSpinBox,
                                StyledInput, StyledButton, StyledListWidget, TitleLabel)
@@ -89,15 +90,19 @@ class BellyTrackerScreen(QWidget):
 
         main_layout.addWidget(splitter)
 
+    def refresh(self):
+        """Перечитує дані при повторному відкритті екрану"""
+        self.load_measurements()
+
     def load_measurements(self):
         try:
             measurements = self.data_controller.db.get_belly_measurements()
             self.measurement_list.clear()
 
             for measurement in measurements:
-                item_text = f"{measurement['date']}: {measurement['measurement']} см"
-                if measurement['notes']:
-                    item_text += f" - {measurement['notes']}"
+                item_text = f"{measurement.date}: {measurement.measurement} см"
+                if measurement.notes:
+                    item_text += f" - {measurement.notes}"
                 self.measurement_list.addItem(item_text)
 
             logger.info(f"Завантажено {len(measurements)} записів про розміри живота")
@@ -112,13 +117,22 @@ class BellyTrackerScreen(QWidget):
             measurement = self.measurement_spin.value()
             notes = self.notes_edit.text().strip()
 
-            self.data_controller.db.add_belly_measurement(date_str, measurement, notes)
-            self.notes_edit.clear()
-            self.load_measurements()
-
-            QMessageBox.information(self, "Успіх", "Запис про розмір живота успішно збережено")
-            logger.info(f"Збережено новий запис про розмір живота: {date_str}, {measurement} см")
+            get_write_queue().submit('add_belly_measurement', date_str, measurement, notes,
+                                     callback=lambda record_id, error: self._on_measurement_saved(
+                                         date_str, measurement, error))
 
         except Exception as e:
             QMessageBox.critical(self, "Помилка", f"Не вдалося зберегти запис: {str(e)}")
-            logger.error(f"Помилка при збереженні запису про розмір живота: {str(e)}")
\ No newline at end of file
+            logger.error(f"Помилка при збереженні запису про розмір живота: {str(e)}")
+
+    def _on_measurement_saved(self, date_str, measurement, error):
+        if error:
+            QMessageBox.critical(self, "Помилка", f"Не вдалося зберегти запис: {error}")
+            logger.error(f"Помилка при збереженні запису про розмір живота: {error}")
+            return
+
+        self.notes_edit.clear()
+        self.load_measurements()
+
+        QMessageBox.information(self, "Успіх", "Запис про розмір живота успішно збережено")
+        logger.info(f"Збережено новий запис про розмір живота: {date_str}, {measurement} см")
\ No newline at end of file
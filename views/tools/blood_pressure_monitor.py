@@ -2,6 +2,7 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QHBoxLayout,
                              QMessageBox, QSplitter, QFormLayout, QSpacerItem, QSizePolicy)
 from PyQt6.QtCore import Qt, QDate, QTime
 from controllers.data_controller import DataController
+from utils.db_worker import get_write_queue
 from utils.logger import get_logger
 from utils.base_widgets import (StyledCard, StyledDateEdit, StyledTimeEdit, StyledSpinBox,
                                StyledInput, StyledButton, StyledListWidget, TitleLabel)
@@ -118,6 +119,10 @@ class BloodPressureMonitorScreen(QWidget):
 
         main_layout.addWidget(splitter)
 
+    def refresh(self):
+        """Перечитує дані при повторному відкритті екрану"""
+        self.load_pressure_records()
+
     def load_pressure_records(self):
         try:
             days = self.period_spin.value() if hasattr(self, 'period_spin') else 30
@@ -125,11 +130,11 @@ class BloodPressureMonitorScreen(QWidget):
             self.pressure_list.clear()
 
             for record in records:
-                item_text = f"{record['date']} {record['time']}: {record['systolic']}/{record['diastolic']} мм рт.ст."
-                if record['pulse']:
-                    item_text += f", пульс: {record['pulse']}"
-                if record['notes']:
-                    item_text += f" - {record['notes']}"
+                item_text = f"{record.date} {record.time}: {record.systolic}/{record.diastolic} мм рт.ст."
+                if record.pulse:
+                    item_text += f", пульс: {record.pulse}"
+                if record.notes:
+                    item_text += f" - {record.notes}"
                 self.pressure_list.addItem(item_text)
 
             logger.info(f"Завантажено {len(records)} записів про тиск за {days} днів")
@@ -152,18 +157,28 @@ class BloodPressureMonitorScreen(QWidget):
                                     "Верхній тиск повинен бути більшим за нижній.\nПеревірте правильність введених значень.")
                 return
 
-            self.data_controller.db.add_blood_pressure(date_str, time_str, systolic, diastolic, pulse, notes)
-            self.notes_edit.clear()
-            self.load_pressure_records()
-
-            QMessageBox.information(self, "Успіх", "Запис тиску успішно збережено")
-            logger.info(f"Збережено новий запис тиску: {date_str} {time_str}, {systolic}/{diastolic}, пульс: {pulse}")
-
-            if systolic >= 140 or diastolic >= 90:
-                QMessageBox.warning(self, "Увага! Підвищений тиск",
-                                    f"Ваш тиск {systolic}/{diastolic} мм рт.ст. перевищує норму.\n"
-                                    "Рекомендується проконсультуватися з лікарем.")
+            get_write_queue().submit(
+                'add_blood_pressure', date_str, time_str, systolic, diastolic, pulse, notes,
+                callback=lambda record_id, error: self._on_pressure_saved(
+                    date_str, time_str, systolic, diastolic, pulse, error))
 
         except Exception as e:
             QMessageBox.critical(self, "Помилка", f"Не вдалося зберегти запис: {str(e)}")
-            logger.error(f"Помилка при збереженні запису тиску: {str(e)}")
\ No newline at end of file
+            logger.error(f"Помилка при збереженні запису тиску: {str(e)}")
+
+    def _on_pressure_saved(self, date_str, time_str, systolic, diastolic, pulse, error):
+        if error:
+            QMessageBox.critical(self, "Помилка", f"Не вдалося зберегти запис: {error}")
+            logger.error(f"Помилка при збереженні запису тиску: {error}")
+            return
+
+        self.notes_edit.clear()
+        self.load_pressure_records()
+
+        QMessageBox.information(self, "Успіх", "Запис тиску успішно збережено")
+        logger.info(f"Збережено новий запис тиску: {date_str} {time_str}, {systolic}/{diastolic}, пульс: {pulse}")
+
+        if systolic >= 140 or diastolic >= 90:
+            QMessageBox.warning(self, "Увага! Підвищений тиск",
+                                f"Ваш тиск {systolic}/{diastolic} мм рт.ст. перевищує норму.\n"
+                                "Рекомендується проконсультуватися з лікарем.")
\ No newline at end of file
@@ -5,6 +5,7 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QPushButton,
 from PyQt6.QtCore import Qt, QDate, QTime, QTimer
 from PyQt6.QtGui import QFont
 from controllers.data_controller import DataController
+from utils.db_worker import get_write_queue
 from utils.logger import get_logger
 from styles.tools import ContractionCounterStyles, SliderStyles
 from styles.base import BaseStyles
@@ -236,6 +237,18 @@ class ContractionCounterScreen(QWidget):
 
         layout.addLayout(buttons_layout)
 
+    def showEvent(self, event):
+        # Під час активного підрахунку записи йдуть сериями, тому комітимо їх групами
+        get_write_queue().enable_group_commit()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        # При закритті додатку черга вже зупинена: не створюємо її заново
+        write_queue = get_write_queue(create=False)
+        if write_queue is not None:
+            write_queue.disable_group_commit()
+        super().hideEvent(event)
+
     def update_timer(self):
         if self.is_timing:
             self.current_seconds += 1
@@ -280,15 +293,13 @@ class ContractionCounterScreen(QWidget):
                 duration = self.current_seconds
                 intensity = self.intensity_slider.value()
 
-                self.data_controller.db.add_contraction(date_str, start_time_str, end_time_str, duration, intensity)
+                get_write_queue().submit('add_contraction', date_str, start_time_str, end_time_str, duration, intensity,
+                                         callback=self._on_contraction_saved)
 
                 self.current_seconds = 0
                 self.timer_label.setText("00:00")
                 self.progress_bar.setValue(0)
 
-                self.load_contractions()
-
-                QMessageBox.information(self, "Успіх", "Запис про перейму успішно збережено")
                 logger.info(f"Збережено перейму: {date_str}, {start_time_str}-{end_time_str}, {duration} сек, інтенсивність: {intensity}")
             else:
                 QMessageBox.warning(self, "Попередження", "Спочатку скористайтеся таймером для вимірювання перейми")
@@ -305,16 +316,27 @@ class ContractionCounterScreen(QWidget):
             duration = self.duration_spin.value()
             intensity = self.manual_intensity_spin.value()
 
-            self.data_controller.db.add_contraction(date_str, start_time_str, end_time_str, duration, intensity)
-            self.load_contractions()
-
-            QMessageBox.information(self, "Успіх", "Запис про перейму успішно збережено")
+            get_write_queue().submit('add_contraction', date_str, start_time_str, end_time_str, duration, intensity,
+                                     callback=self._on_contraction_saved)
             logger.info(f"Збережено перейму (ручний запис): {date_str}, {start_time_str}-{end_time_str}, {duration} сек, інтенсивність: {intensity}")
 
         except Exception as e:
             QMessageBox.critical(self, "Помилка", f"Не вдалося зберегти запис: {str(e)}")
             logger.error(f"Помилка при збереженні перейми вручну: {str(e)}")
 
+    def _on_contraction_saved(self, contraction_id, error):
+        if error:
+            QMessageBox.critical(self, "Помилка", f"Не вдалося зберегти запис: {error}")
+            logger.error(f"Помилка при збереженні перейми: {error}")
+            return
+
+        self.load_contractions()
+        QMessageBox.information(self, "Успіх", "Запис про перейму успішно збережено")
+
+    def refresh(self):
+        """Перечитує дані при повторному відкритті екрану"""
+        self.load_contractions()
+
     def load_contractions(self):
         try:
             days = self.period_spin.value() if hasattr(self, 'period_spin') else 1
@@ -324,8 +346,8 @@ class ContractionCounterScreen(QWidget):
                 self.contractions_list.clear()
 
                 for contraction in contractions:
-                    item_text = f"{contraction['date']} {contraction['start_time']}-{contraction['end_time']}: " \
-                                f"{contraction['duration']} сек., інтенсивність: {contraction['intensity']}/10"
+                    item_text = f"{contraction.date} {contraction.start_time}-{contraction.end_time}: " \
+                                f"{contraction.duration} сек., інтенсивність: {contraction.intensity}/10"
                     self.contractions_list.addItem(item_text)
 
                 logger.info(f"Завантажено {len(contractions)} записів переймів за {days} день/днів")
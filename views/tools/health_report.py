@@ -1,15 +1,19 @@
 import datetime
-from reportlab.lib.pagesizes import A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTextEdit, QHBoxLayout, QSplitter, QLabel
 from PyQt6.QtCore import QDate
 from controllers.data_controller import DataController
+from utils.db_worker import get_write_queue
 from utils.logger import get_logger
+from utils.lazy_import import lazy_module
 from utils.base_widgets import StyledCard, StyledInput, StyledDateEdit, StyledButton, StyledListWidget, TitleLabel
 from styles.tools import HealthReportStyles
 from styles.base import BaseStyles
 
+# reportlab потрібен лише для експорту PDF, тож завантажується при першому експорті
+pagesizes = lazy_module('reportlab.lib.pagesizes')
+platypus = lazy_module('reportlab.platypus')
+reportlab_styles = lazy_module('reportlab.lib.styles')
+
 logger = get_logger('health_report')
 
 class HealthReportScreen(QWidget):
@@ -97,13 +101,17 @@ class HealthReportScreen(QWidget):
 
         main_layout.addWidget(splitter)
 
+    def refresh(self):
+        """Перечитує дані при повторному відкритті екрану"""
+        self.load_notes()
+
     def load_notes(self):
         try:
             notes = self.data_controller.db.get_health_notes()
             self.notes_list.clear()
 
             for note in notes:
-                item_text = f"{note['date']} - {note['title']}"
+                item_text = f"{note.date} - {note.title}"
                 self.notes_list.addItem(item_text)
 
             logger.info(f"Завантажено {len(notes)} нотаток про здоров'я")
@@ -119,16 +127,22 @@ class HealthReportScreen(QWidget):
             if not content:
                 return
 
-            self.data_controller.db.add_health_note(date_str, content, title)
-
-            self.title_edit.clear()
-            self.content_edit.clear()
-            self.load_notes()
-
-            logger.info(f"Збережено нову нотатку про здоров'я: {date_str}, {title}")
+            get_write_queue().submit('add_health_note', date_str, content, title,
+                                     callback=lambda note_id, error: self._on_note_saved(date_str, title, error))
         except Exception as e:
             logger.error(f"Помилка при збереженні нотатки: {str(e)}")
 
+    def _on_note_saved(self, date_str, title, error):
+        if error:
+            logger.error(f"Помилка при збереженні нотатки: {error}")
+            return
+
+        self.title_edit.clear()
+        self.content_edit.clear()
+        self.load_notes()
+
+        logger.info(f"Збережено нову нотатку про здоров'я: {date_str}, {title}")
+
     def export_to_pdf(self):
         try:
             notes = self.data_controller.db.get_health_notes()
@@ -142,36 +156,36 @@ class HealthReportScreen(QWidget):
             current_week = self.data_controller.get_current_week() or "невідомо"
             user_profile = self.data_controller.user_profile
 
-            document = SimpleDocTemplate(file_name, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=72)
+            document = platypus.SimpleDocTemplate(file_name, pagesize=pagesizes.A4, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=72)
 
-            styles = getSampleStyleSheet()
+            styles = reportlab_styles.getSampleStyleSheet()
             title_style = styles["Heading1"]
             subtitle_style = styles["Heading2"]
             normal_style = styles["Normal"]
 
             content = []
-            content.append(Paragraph("Звіт про здоров'я", title_style))
-            content.append(Spacer(1, 12))
+            content.append(platypus.Paragraph("Звіт про здоров'я", title_style))
+            content.append(platypus.Spacer(1, 12))
 
-            content.append(Paragraph("Інформація про користувача", subtitle_style))
-            content.append(Spacer(1, 6))
-            content.append(Paragraph(f"Ім'я: {user_profile.name}", normal_style))
-            content.append(Paragraph(f"Поточний тиждень: {current_week}", normal_style))
-            if pregnancy_data.due_date:
-                content.append(Paragraph(f"Очікувана дата пологів: {pregnancy_data.due_date.strftime('%d.%m.%Y')}", normal_style))
-            content.append(Spacer(1, 12))
+            content.append(platypus.Paragraph("Інформація про користувача", subtitle_style))
+            content.append(platypus.Spacer(1, 6))
+            content.append(platypus.Paragraph(f"Ім'я: {user_profile.name}", normal_style))
+            content.append(platypus.Paragraph(f"Поточний тиждень: {current_week}", normal_style))
+            if pregnancy_data and pregnancy_data.due_date:
+                content.append(platypus.Paragraph(f"Очікувана дата пологів: {pregnancy_data.due_date.strftime('%d.%m.%Y')}", normal_style))
+            content.append(platypus.Spacer(1, 12))
 
-            content.append(Paragraph("Нотатки про здоров'я", subtitle_style))
-            content.append(Spacer(1, 6))
+            content.append(platypus.Paragraph("Нотатки про здоров'я", subtitle_style))
+            content.append(platypus.Spacer(1, 6))
 
             for note in notes:
-                note_date = note['date']
-                note_title = note['title'] or "Без заголовку"
-                note_content = note['content']
+                note_date = note.date
+                note_title = note.title or "Без заголовку"
+                note_content = note.content
 
-                content.append(Paragraph(f"<b>{note_date} - {note_title}</b>", normal_style))
-                content.append(Paragraph(note_content, normal_style))
-                content.append(Spacer(1, 12))
+                content.append(platypus.Paragraph(f"<b>{note_date} - {note_title}</b>", normal_style))
+                content.append(platypus.Paragraph(note_content, normal_style))
+                content.append(platypus.Spacer(1, 12))
 
             document.build(content)
             logger.info(f"Експортовано PDF-звіт: {file_name}")
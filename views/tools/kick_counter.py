@@ -1,6 +1,7 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QHBoxLayout,QMessageBox, QSplitter
 from PyQt6.QtCore import Qt, QDate, QTime
 from controllers.data_controller import DataController
+from utils.db_worker import get_write_queue
 from utils.logger import get_logger
 from utils.base_widgets import (StyledCard, StyledDateEdit, StyledTimeEdit, StyledSpinBox,
                                StyledButton, StyledListWidget, TitleLabel)
@@ -102,13 +103,29 @@ class KickCounterScreen(QWidget):
 
         main_layout.addWidget(splitter)
 
+    def showEvent(self, event):
+        # Під час активного підрахунку записи йдуть сериями, тому комітимо їх групами
+        get_write_queue().enable_group_commit()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        # При закритті додатку черга вже зупинена: не створюємо її заново
+        write_queue = get_write_queue(create=False)
+        if write_queue is not None:
+            write_queue.disable_group_commit()
+        super().hideEvent(event)
+
+    def refresh(self):
+        """Перечитує дані при повторному відкритті екрану"""
+        self.load_kicks()
+
     def load_kicks(self):
         try:
             kicks = self.data_controller.db.get_baby_kicks()
             self.kicks_list.clear()
 
             for kick in kicks:
-                item_text = f"{kick['date']} {kick['time']}: {kick['count']} поштовхів"
+                item_text = f"{kick.date} {kick.time}: {kick.count} поштовхів"
                 self.kicks_list.addItem(item_text)
 
             logger.info(f"Завантажено {len(kicks)} записів поштовхів")
@@ -123,12 +140,20 @@ class KickCounterScreen(QWidget):
             time_str = self.time_edit.time().toString("HH:mm")
             count = self.kicks_spin.value()
 
-            self.data_controller.db.add_baby_kick(date_str, time_str, count)
-            self.load_kicks()
-
-            QMessageBox.information(self, "Успіх", "Запис поштовхів успішно збережено")
-            logger.info(f"Збережено новий запис поштовхів: {date_str} {time_str}, кількість: {count}")
+            get_write_queue().submit('add_baby_kick', date_str, time_str, count,
+                                     callback=lambda kick_id, error: self._on_kicks_saved(date_str, time_str, count, error))
 
         except Exception as e:
             QMessageBox.critical(self, "Помилка", f"Не вдалося зберегти запис: {str(e)}")
-            logger.error(f"Помилка при збереженні запису поштовхів: {str(e)}")
\ No newline at end of file
+            logger.error(f"Помилка при збереженні запису поштовхів: {str(e)}")
+
+    def _on_kicks_saved(self, date_str, time_str, count, error):
+        if error:
+            QMessageBox.critical(self, "Помилка", f"Не вдалося зберегти запис: {error}")
+            logger.error(f"Помилка при збереженні запису поштовхів: {error}")
+            return
+
+        self.load_kicks()
+
+        QMessageBox.information(self, "Успіх", "Запис поштовхів успішно збережено")
+        logger.info(f"Збережено новий запис поштовхів: {date_str} {time_str}, кількість: {count}")
\ No newline at end of file
@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QScrollArea,
                              QFrame, QGridLayout, QSizePolicy, QMessageBox, QStackedWidget)
 from PyQt6.QtCore import Qt
@@ -5,6 +6,8 @@ from PyQt6.QtGui import QFont
 
 from controllers.data_controller import DataController
 from styles.base import BaseStyles, Colors
+from utils.db_worker import write_generation
+from utils.logger import get_logger
 
 from .health_report import HealthReportScreen
 from .kegel_exercises import KegelExercisesScreen
@@ -15,6 +18,73 @@ from .belly_tracker import BellyTrackerScreen
 from .blood_pressure_monitor import BloodPressureMonitorScreen
 from .wishlist import WishlistScreen
 
+logger = get_logger('tools_screen')
+
+# Скільки екранів інструментів тримати створеними одночасно
+MAX_CACHED_TOOL_SCREENS = 4
+
+
+class ToolScreenManager:
+    """Кеш екранів інструментів у головному стеку: повторне відкриття показує наявний екран,
+    найдавніше невикористані екрани видаляються (LRU)"""
+
+    def __init__(self, tools_screen, capacity=MAX_CACHED_TOOL_SCREENS):
+        self.tools_screen = tools_screen
+        self.capacity = capacity
+        # screen_class -> (екран, (користувач, лічильник записів) на момент останнього завантаження)
+        self._screens = OrderedDict()
+
+    def _find_main_stack(self):
+        main_window = self.tools_screen.parent
+        if main_window:
+            for child in main_window.findChildren(QStackedWidget):
+                return child
+        return None
+
+    def _current_user_id(self):
+        return getattr(self.tools_screen.parent, 'current_user_id', None)
+
+    def open(self, screen_class):
+        """Показує екран інструменту; повертає False, якщо головний стек не знайдено"""
+        main_stack = self._find_main_stack()
+        if not main_stack:
+            return False
+
+        user_id = self._current_user_id()
+        cached = self._screens.pop(screen_class, None)
+        if cached and cached[1][0] != user_id:
+            # Екран створений для іншого користувача: створюємо заново
+            self._remove(main_stack, cached[0])
+            cached = None
+
+        if cached:
+            screen, (_, generation) = cached
+            if generation != write_generation() and hasattr(screen, 'refresh'):
+                screen.refresh()
+                logger.info(f"Оновлено дані екрану {screen_class.__name__}")
+        else:
+            screen = screen_class(self.tools_screen.parent)
+            main_stack.addWidget(screen)
+            logger.info(f"Створено екран інструменту {screen_class.__name__}")
+
+        self._screens[screen_class] = (screen, (user_id, write_generation()))
+        main_stack.setCurrentWidget(screen)
+        self._evict(main_stack)
+        return True
+
+    def _evict(self, main_stack):
+        while len(self._screens) > self.capacity:
+            screen_class, (screen, _) = next(iter(self._screens.items()))
+            if screen is main_stack.currentWidget():
+                break
+            del self._screens[screen_class]
+            self._remove(main_stack, screen)
+            logger.info(f"Видалено невикористаний екран інструменту {screen_class.__name__}")
+
+    def _remove(self, main_stack, screen):
+        main_stack.removeWidget(screen)
+        screen.deleteLater()
+
 
 class ToolCard(QFrame):
     def __init__(self, title, description, icon_path, screen_class, accent_color="#FF8C00", parent=None):
@@ -134,30 +204,19 @@ class ToolCard(QFrame):
 
             if self.screen_class:
                 try:
-                    tool_screen = self.screen_class(self.parent)
-                    main_stack = self._find_main_stack()
-
-                    if main_stack:
-                        index = main_stack.addWidget(tool_screen)
-                        main_stack.setCurrentIndex(index)
-                    else:
+                    if not self.parent.tool_screens.open(self.screen_class):
                         QMessageBox.warning(self, "Помилка", "Не вдалося відкрити інструмент")
                 except Exception as e:
                     QMessageBox.critical(self, "Помилка", f"Не вдалося відкрити інструмент: {str(e)}")
         super().mouseReleaseEvent(event)
 
-    def _find_main_stack(self):
-        if hasattr(self.parent, 'parent') and self.parent.parent:
-            for child in self.parent.parent.findChildren(QStackedWidget):
-                return child
-        return None
-
 
 class ToolsScreen(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent = parent
         self.data_controller = DataController()
+        self.tool_screens = ToolScreenManager(self)
         self._setup_ui()
 
     def _setup_ui(self):
@@ -1,6 +1,7 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QHBoxLayout, QMessageBox, QSplitter
 from PyQt6.QtCore import Qt, QDate
 from controllers.data_controller import DataController
+from utils.db_worker import get_write_queue
 from utils.logger import get_logger
 from utils.base_widgets import (StyledCard, StyledDateEdit, StyledDoubleSpinBox,
                                StyledButton, StyledListWidget, TitleLabel)
@@ -92,6 +93,10 @@ class WeightMonitorScreen(QWidget):
 
         main_layout.addWidget(splitter)
 
+    def refresh(self):
+        """Перечитує дані при повторному відкритті екрану"""
+        self.load_weight_records()
+
     def load_weight_records(self):
         try:
             records = self.data_controller.db.get_weight_records()
@@ -118,15 +123,22 @@ class WeightMonitorScreen(QWidget):
             date_str = self.date_edit.date().toString("yyyy-MM-dd")
             weight = self.weight_spin.value()
 
-            self.data_controller.db.add_weight_record(date_str, weight)
-
-            # Перевірка, чи існує атрибут weight_list
-            if hasattr(self, 'weight_list'):
-                self.load_weight_records()
-
-            QMessageBox.information(self, "Успіх", "Запис успішно збережено")
-            logger.info(f"Збережено новий запис ваги: {date_str}, {weight} кг")
+            get_write_queue().submit('add_weight_record', date_str, weight,
+                                     callback=lambda record_id, error: self._on_weight_saved(date_str, weight, error))
 
         except Exception as e:
             QMessageBox.critical(self, "Помилка", f"Не вдалося зберегти запис: {str(e)}")
-            logger.error(f"Помилка при збереженні запису ваги: {str(e)}")
\ No newline at end of file
+            logger.error(f"Помилка при збереженні запису ваги: {str(e)}")
+
+    def _on_weight_saved(self, date_str, weight, error):
+        if error:
+            QMessageBox.critical(self, "Помилка", f"Не вдалося зберегти запис: {error}")
+            logger.error(f"Помилка при збереженні запису ваги: {error}")
+            return
+
+        # Перевірка, чи існує атрибут weight_list
+        if hasattr(self, 'weight_list'):
+            self.load_weight_records()
+
+        QMessageBox.information(self, "Успіх", "Запис успішно збережено")
+        logger.info(f"Збережено новий запис ваги: {date_str}, {weight} кг")
\ No newline at end of file
@@ -126,6 +126,10 @@ class WishlistScreen(QWidget):
 
         main_layout.addWidget(splitter)
 
+    def refresh(self):
+        """Перечитує дані при повторному відкритті екрану"""
+        self.load_wishlist()
+
     def load_wishlist(self):
         try:
             category = None
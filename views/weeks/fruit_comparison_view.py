@@ -1,11 +1,10 @@
 from PyQt6.QtWidgets import QVBoxLayout, QLabel, QSizePolicy, QHBoxLayout, QFrame
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont, QPixmap
-from utils.image_utils import generate_fruit_image
+from PyQt6.QtGui import QFont
 from utils.logger import get_logger
 from styles.weeks import WeeksStyles
 from styles.base import Colors
-import os
+from .week_images import IMAGE_SIZE, get_week_image_cache, placeholder_pixmap
 
 logger = get_logger('fruit_comparison_view')
 
@@ -44,7 +43,7 @@ class FruitComparisonView(QFrame):
         self.image_label = QLabel()
         self.image_label.setObjectName("fruit_image")
         self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.image_label.setFixedSize(180, 180)
+        self.image_label.setFixedSize(IMAGE_SIZE, IMAGE_SIZE)
         self.image_label.setStyleSheet("background: transparent; border: none;")
         self.content_layout.addWidget(self.image_label)
 
@@ -93,75 +92,17 @@ class FruitComparisonView(QFrame):
             self.weight_label.setText(f"Вага: {self.fruit_data.get('weight', 'невідомо')}")
             self.length_label.setText(f"Довжина: {self.fruit_data.get('length', 'невідомо')}")
             self.description_label.setText(self.fruit_data.get('description', 'Дитина продовжує набирати вагу'))
-            self.image_label.setPixmap(self._load_image_for_week(self.week))
-
-    def _load_image_for_week(self, week):
-        possible_paths = self._get_possible_image_paths(week)
-
-        for image_path in possible_paths:
-            logger.info(f"Спроба завантажити зображення: {image_path}")
-            if os.path.exists(image_path):
-                try:
-                    pixmap = QPixmap(image_path)
-                    if not pixmap.isNull():
-                        logger.info(f"Зображення успішно завантажено: {image_path}")
-                        scaled_pixmap = pixmap.scaled(180, 180, Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                                                      Qt.TransformationMode.SmoothTransformation)
-                        return self._create_circular_pixmap(scaled_pixmap)
-                except Exception as e:
-                    logger.error(f"Помилка завантаження зображення {image_path}: {e}")
-
-        logger.warning(f"Не вдалося знайти зображення для тижня {week}, використовуємо запасний варіант")
-        fallback_pixmap = generate_fruit_image(week, size=180)  # Зменшено з 200
-        return self._create_circular_pixmap(fallback_pixmap)
-
-    def _create_circular_pixmap(self, pixmap):
-        """Створює кругле зображення з пікселарта"""
-        from PyQt6.QtGui import QPainter, QBrush, QPainterPath
-
-        size = 180  # Зменшено з 200
-        circular_pixmap = QPixmap(size, size)
-        circular_pixmap.fill(Qt.GlobalColor.transparent)
-
-        painter = QPainter(circular_pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        # Створюємо круглий шлях
-        path = QPainterPath()
-        path.addEllipse(0, 0, size, size)
-        painter.setClipPath(path)
-
-        # Масштабуємо та центруємо зображення
-        if pixmap.width() != size or pixmap.height() != size:
-            pixmap = pixmap.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                                   Qt.TransformationMode.SmoothTransformation)
-
-        # Центруємо зображення
-        x = (size - pixmap.width()) // 2
-        y = (size - pixmap.height()) // 2
-        painter.drawPixmap(x, y, pixmap)
-
-        painter.end()
-        return circular_pixmap
-
-    def _get_possible_image_paths(self, week):
-        base_path = "resources/images/fruits"
-        formats = ['.png', '.jpg', '.jpeg']
-        prefixes = ['', 'week', 'week_', 'тиждень', 'тиждень_']
-
-        paths = []
-
-        if 'image' in self.fruit_data and self.fruit_data['image']:
-            paths.append(self.fruit_data['image'])
-
-        for prefix in prefixes:
-            for fmt in formats:
-                if prefix:
-                    paths.append(f"{base_path}/{prefix}{week}{fmt}")
-                else:
-                    paths.append(f"{base_path}/{week}{fmt}")
-
-        return paths
+            self._show_image_for_week(self.week)
+
+    def _show_image_for_week(self, week):
+        # Готове зображення з кешу або заглушка, яку замінить результат фонового декодування
+        pixmap = get_week_image_cache().request(self, week, self._on_image_loaded, self.fruit_data.get('image'),
+                                                IMAGE_SIZE, self.devicePixelRatioF())
+        self.image_label.setPixmap(pixmap if pixmap is not None else placeholder_pixmap(week, IMAGE_SIZE))
+
+    def _on_image_loaded(self, week, pixmap):
+        if week == self.week:
+            self.image_label.setPixmap(pixmap)
 
     def update_fruit_data(self, week, fruit_data):
         logger.info(f"Оновлення даних порівняння для тижня {week}")
@@ -0,0 +1,51 @@
+"""Відстеження змін у теці ресурсів для режиму розробки (PREGNANCY_WATCH_RESOURCES=1).
+
+QFileSystemWatcher стежить за теками індексу ресурсів і файлами зображень тижнів;
+при змінах індекс перебудовується, а слухачі отримують сигнал changed.
+"""
+import os
+from PyQt6.QtCore import QObject, QFileSystemWatcher, pyqtSignal
+from utils.logger import get_logger
+from utils.resource_index import get_resource_index
+
+logger = get_logger('resource_watcher')
+
+WATCH_ENV = 'PREGNANCY_WATCH_RESOURCES'
+
+
+class ResourceWatcher(QObject):
+    changed = pyqtSignal()
+
+    def __init__(self, index, parent=None):
+        super().__init__(parent)
+        self.index = index
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_changed)
+        self._watcher.fileChanged.connect(self._on_changed)
+        self._update_watched_paths()
+        logger.info(f"Увімкнено відстеження змін у {index.root}")
+
+    def _update_watched_paths(self):
+        watched = self._watcher.directories() + self._watcher.files()
+        if watched:
+            self._watcher.removePaths(watched)
+        self._watcher.addPaths(self.index.directories)
+        # Зміну вмісту файлу (без перейменування) тека не помічає, тому зображення тижнів відстежуються окремо
+        self._watcher.addPaths(self.index.week_image_paths())
+
+    def _on_changed(self, path):
+        logger.info(f"Змінено ресурси ({path}), перебудовуємо індекс")
+        self.index.scan()
+        self._update_watched_paths()
+        self.changed.emit()
+
+
+_resource_watcher = None
+
+
+def get_resource_watcher():
+    """Спільний спостерігач за ресурсами, якщо його ввімкнено змінною середовища, інакше None"""
+    global _resource_watcher
+    if _resource_watcher is None and os.environ.get(WATCH_ENV, '').lower() in ('1', 'true', 'yes', 'on'):
+        _resource_watcher = ResourceWatcher(get_resource_index())
+    return _resource_watcher
@@ -0,0 +1,216 @@
+"""Кругле зображення фрукта для тижня: мініатюра, оригінал або згенерована заглушка.
+
+Декодування виконується в пулі потоків (QImageReader одразу в цільовому розмірі), а поки
+зображення не готове, показується заглушка generate_fruit_image. Готові QPixmap тримаються
+в LRU-кеші за ключем (тиждень, розмір, DPR); сусідні тижні завантажуються заздалегідь,
+а після входу у фоні підвантажуються всі тижні, тож перехід на будь-який тиждень миттєвий.
+Запити на тижні, з яких користувач уже пішов, скасовуються.
+"""
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QImage, QPixmap
+from utils.image_utils import generate_fruit_image
+from utils.logger import get_logger
+from utils.pixmap_cache import PixmapCache
+from utils.resource_index import get_resource_index
+from utils.thumbnails import get_thumbnail_cache, render_circular
+from .resource_watcher import get_resource_watcher
+
+logger = get_logger('week_images')
+
+IMAGE_SIZE = 180
+# Усі 40 тижнів у 2x (~20 МБ) з запасом
+CACHE_MAX_BYTES = 24 * 1024 * 1024
+DECODE_THREADS = 2
+# Зображення, на яке чекає екран, декодується раніше за попереднє завантаження сусідів
+VISIBLE_PRIORITY = 1
+PREFETCH_PRIORITY = 0
+PRELOAD_PRIORITY = -1
+
+
+def _scale_for(dpr):
+    return 2 if dpr > 1 else 1
+
+
+def decode_week_image(week, image_hint=None, size=IMAGE_SIZE, scale=1):
+    """Кругле зображення тижня розміром size * scale як QImage (безпечно для фонових потоків); None, якщо немає"""
+    image_path = get_resource_index().week_image(week, image_hint)
+    if image_path:
+        if size == IMAGE_SIZE:
+            thumbnail_path = get_thumbnail_cache().get(image_path, scale)
+            if thumbnail_path:
+                image = QImage(thumbnail_path)
+                if not image.isNull():
+                    return image
+        # Мініатюри немає: декодуємо оригінал одразу в потрібному розмірі
+        image = render_circular(image_path, size * scale)
+        if image is not None:
+            return image
+    logger.warning(f"Не вдалося знайти зображення для тижня {week}, використовуємо запасний варіант")
+    return None
+
+
+def placeholder_pixmap(week, size=IMAGE_SIZE):
+    """Кольорове коло тижня, поки справжнє зображення декодується"""
+    return generate_fruit_image(week, size=size)
+
+
+class _DecodeTask(QRunnable):
+    def __init__(self, cache, key, image_hint):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.cache = cache
+        self.key = key
+        self.image_hint = image_hint
+        self.cancelled = False
+
+    def run(self):
+        if self.cancelled:
+            return
+        week, size, scale = self.key
+        try:
+            image = decode_week_image(week, self.image_hint, size, scale)
+        except Exception as e:
+            logger.error(f"Помилка декодування зображення тижня {week}: {e}")
+            image = None
+        self.cache._decoded.emit(self, image)
+
+
+class WeekImageCache(QObject):
+    """Кеш круглих зображень тижнів з фоновим декодуванням і попереднім завантаженням сусідів"""
+    _decoded = pyqtSignal(object, object)
+
+    def __init__(self, max_bytes=CACHE_MAX_BYTES, parent=None):
+        super().__init__(parent)
+        self.cache = PixmapCache(max_bytes)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(DECODE_THREADS)
+        # ключ -> задача декодування, що ще не завершилась
+        self._tasks = {}
+        # ключ -> [(власник, callback)]; власник — віджет, якому потрібен результат
+        self._waiters = {}
+        self._prefetch_keys = set()
+        self._preload_keys = set()
+        self._decoded.connect(self._on_decoded)
+        # Індекс створюється тут, у потоці інтерфейсу, бо фонові задачі лише читають його
+        get_resource_index()
+        watcher = get_resource_watcher()
+        if watcher is not None:
+            watcher.changed.connect(self._on_resources_changed)
+
+    def cached(self, week, size=IMAGE_SIZE, dpr=1.0):
+        return self.cache.get((week, size, _scale_for(dpr)))
+
+    def pixmap(self, week, image_hint=None, size=IMAGE_SIZE, dpr=1.0):
+        """Синхронне завантаження в поточному потоці (для коду, якому не потрібна асинхронність)"""
+        key = (week, size, _scale_for(dpr))
+        pixmap = self.cache.get(key)
+        if pixmap is None:
+            pixmap = self._to_pixmap(key, decode_week_image(week, image_hint, size, key[2]))
+            self.cache.put(key, pixmap)
+        return pixmap
+
+    def request(self, owner, week, callback, image_hint=None, size=IMAGE_SIZE, dpr=1.0):
+        """Повертає готовий QPixmap з кешу або None; в останньому випадку ставить декодування в чергу
+        і викликає callback(week, pixmap) у потоці інтерфейсу. Попередній запит того ж власника скасовується"""
+        key = (week, size, _scale_for(dpr))
+        self.cancel(owner, keep=key)
+        pixmap = self.cache.get(key)
+        if pixmap is not None:
+            return pixmap
+        self._waiters.setdefault(key, []).append((owner, callback))
+        self._schedule(key, image_hint, VISIBLE_PRIORITY)
+        return None
+
+    def cancel(self, owner, keep=None):
+        """Прибирає очікування власника; задачі, які більше нікому не потрібні, знімаються з черги"""
+        for key in list(self._waiters):
+            if key == keep:
+                continue
+            waiters = [w for w in self._waiters[key] if w[0] is not owner]
+            if waiters:
+                self._waiters[key] = waiters
+            else:
+                del self._waiters[key]
+                if key not in self._prefetch_keys and key not in self._preload_keys:
+                    self._drop_task(key)
+
+    def prefetch(self, weeks, size=IMAGE_SIZE, dpr=1.0):
+        """Фонове завантаження тижнів; попереднє, ще не розпочате, завантаження скасовується"""
+        keys = {(week, size, _scale_for(dpr)) for week in weeks}
+        for key in self._prefetch_keys - keys:
+            if key not in self._waiters and key not in self._preload_keys:
+                self._drop_task(key)
+        self._prefetch_keys = {key for key in keys if key not in self.cache}
+        for key in self._prefetch_keys:
+            self._schedule(key, None, PREFETCH_PRIORITY)
+
+    def preload(self, weeks, size=IMAGE_SIZE, dpr=1.0):
+        """Фонове завантаження всіх тижнів з найнижчим пріоритетом; на відміну від prefetch не скасовується"""
+        keys = {(week, size, _scale_for(dpr)) for week in weeks} - self._preload_keys
+        for key in keys:
+            if key not in self.cache:
+                self._preload_keys.add(key)
+                self._schedule(key, None, PRELOAD_PRIORITY)
+
+    def _schedule(self, key, image_hint, priority):
+        if key in self._tasks:
+            return
+        task = self._tasks[key] = _DecodeTask(self, key, image_hint)
+        self._pool.start(task, priority)
+
+    def _drop_task(self, key):
+        task = self._tasks.pop(key, None)
+        if task is not None:
+            task.cancelled = True
+            if self._pool.tryTake(task):
+                logger.debug(f"Скасовано декодування зображення тижня {key[0]}")
+
+    def _to_pixmap(self, key, image):
+        week, size, scale = key
+        if image is None:
+            return placeholder_pixmap(week, size)
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(scale)
+        return pixmap
+
+    def _on_decoded(self, task, image):
+        key = task.key
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        self._prefetch_keys.discard(key)
+        self._preload_keys.discard(key)
+        if task.cancelled and image is None:
+            return
+        # Навіть скасований результат, якщо вже декодований, іде в кеш — але нікому не показується
+        pixmap = self._to_pixmap(key, image)
+        self.cache.put(key, pixmap)
+        for owner, callback in self._waiters.pop(key, []):
+            if not sip.isdeleted(owner):
+                callback(key[0], pixmap)
+
+    def _on_resources_changed(self):
+        get_thumbnail_cache().forget()
+        self.cache.clear()
+
+    def shutdown(self):
+        self._preload_keys.clear()
+        self._pool.clear()
+        self._pool.waitForDone()
+
+
+_week_image_cache = None
+
+
+def get_week_image_cache():
+    """Повертає спільний для процесу кеш зображень тижнів"""
+    global _week_image_cache
+    if _week_image_cache is None:
+        _week_image_cache = WeekImageCache()
+    return _week_image_cache
+
+
+def stop_week_image_loading():
+    """Скасовує чергу декодування і чекає на завершення розпочатих задач"""
+    if _week_image_cache is not None:
+        _week_image_cache.shutdown()
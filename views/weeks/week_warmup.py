@@ -0,0 +1,71 @@
+"""Підготовка даних усіх тижнів у вільний час після входу.
+
+Тексти карток і дані фрукта для кожного тижня складаються порціями по одному тижню
+на ітерацію циклу подій (QTimer з нульовим інтервалом), тож інтерфейс не блокується;
+після текстів у пул декодування ставляться зображення всіх тижнів. Коли стать дитини
+змінюється, кеш скидається і підготовка запускається заново для нової статі.
+"""
+import time
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from controllers.baby_development_controller import get_week_payload_cache
+from utils.logger import get_logger
+from .week_images import get_week_image_cache
+
+logger = get_logger('week_warmup')
+
+WARMUP_DELAY_MS = 1000
+
+
+class WeekWarmup(QObject):
+    # Кеш даних тижнів скинуто через зміну статі; сигнал доставляє подію в потік інтерфейсу
+    invalidated = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        payloads = self.payloads = get_week_payload_cache()
+        self.invalidated.connect(self._on_invalidated)
+        listener = self.invalidated.emit
+        payloads.add_invalidation_listener(listener)
+        self.destroyed.connect(lambda: payloads.remove_invalidation_listener(listener))
+        self.gender = None
+        self.dpr = 1.0
+        self._pending = []
+        self._started_at = None
+        self._delay_timer = QTimer(self)
+        self._delay_timer.setSingleShot(True)
+        self._delay_timer.timeout.connect(self._begin)
+        self._step_timer = QTimer(self)
+        self._step_timer.setInterval(0)
+        self._step_timer.timeout.connect(self._step)
+
+    def start(self, gender, dpr=1.0, delay_ms=WARMUP_DELAY_MS):
+        self.stop()
+        self.gender = gender
+        self.dpr = dpr
+        self._delay_timer.start(delay_ms)
+
+    def stop(self):
+        self._delay_timer.stop()
+        self._step_timer.stop()
+        self._pending = []
+        self.gender = None
+
+    def _begin(self):
+        weeks = self.payloads.controller.get_available_weeks()
+        self._pending = [week for week in reversed(weeks) if not self.payloads.is_cached(week, self.gender)]
+        self._started_at = time.perf_counter()
+        self._step_timer.start()
+
+    def _step(self):
+        if self._pending:
+            self.payloads.get(self._pending.pop(), self.gender)
+            return
+        self._step_timer.stop()
+        weeks = self.payloads.controller.get_available_weeks()
+        get_week_image_cache().preload(weeks, dpr=self.dpr)
+        elapsed = (time.perf_counter() - self._started_at) * 1000
+        logger.info(f"Підготовлено дані {len(weeks)} тижнів за {elapsed:.1f} мс, зображення завантажуються у фоні")
+
+    def _on_invalidated(self, gender):
+        if self.gender is not None:
+            self.start(gender, self.dpr)
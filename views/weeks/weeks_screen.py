@@ -2,8 +2,9 @@ from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QHBoxLayo
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 from controllers.data_controller import DataController
-from controllers.baby_development_controller import BabyDevelopmentController
+from controllers.baby_development_controller import BabyDevelopmentController, get_week_payload_cache
 from .fruit_comparison_view import FruitComparisonView
+from .week_images import get_week_image_cache
 from utils.logger import get_logger
 from styles.weeks import WeeksStyles
 from styles.base import BaseStyles, Colors
@@ -43,21 +44,30 @@ class InfoCard(QFrame):
         layout.setSpacing(12)
 
         # Простий заголовок - як у верхніх блоках
-        title_label = QLabel(self.title)
-        title_label.setFont(QFont('Arial', 18, QFont.Weight.Bold))
-        title_label.setStyleSheet(f"color: {Colors.TEXT_ACCENT}; font-weight: 700; background: transparent;")
-        layout.addWidget(title_label)
+        self.title_label = QLabel(self.title)
+        self.title_label.setFont(QFont('Arial', 18, QFont.Weight.Bold))
+        self.title_label.setStyleSheet(f"color: {Colors.TEXT_ACCENT}; font-weight: 700; background: transparent;")
+        layout.addWidget(self.title_label)
 
         # Контент
-        content_label = QLabel(self.content)
-        content_label.setWordWrap(True)
-        content_label.setFont(QFont('Arial', 14))
-        content_label.setStyleSheet(
+        self.content_label = QLabel(self.content)
+        self.content_label.setWordWrap(True)
+        self.content_label.setFont(QFont('Arial', 14))
+        self.content_label.setStyleSheet(
             f"color: {Colors.TEXT_PRIMARY}; font-weight: 500; line-height: 1.6; background: transparent;")
-        layout.addWidget(content_label)
+        layout.addWidget(self.content_label)
 
         self.setMinimumHeight(120)
 
+    def update_card_data(self, title, content):
+        """Оновлює текст картки на місці, без перебудови віджетів і стилів"""
+        if title != self.title:
+            self.title = title
+            self.title_label.setText(title)
+        if content != self.content:
+            self.content = content
+            self.content_label.setText(content)
+
     def enterEvent(self, event):
         self.is_hover = True
         self.setStyleSheet(f"""
@@ -237,6 +247,9 @@ class WeeksScreen(QWidget):
 
         self.inner_layout.addWidget(cards_section)
 
+        # Картки створюються один раз; при зміні тижня оновлюється лише їхній текст
+        self.info_cards = []
+
         layout_container = QHBoxLayout()
         layout_container.addStretch()
         layout_container.addWidget(content_container)
@@ -289,57 +302,41 @@ class WeeksScreen(QWidget):
         self.current_displayed_week = week
         self.week_title.setText(f"Тиждень {week}")
 
-        self._clear_cards()
-        self._update_fruit_comparison(week)
-        self._create_info_cards(week)
-
-    def _clear_cards(self):
-        for i in reversed(range(self.cards_layout.count())):
-            widget = self.cards_layout.itemAt(i).widget()
-            if widget:
-                widget.deleteLater()
-
-    def _update_fruit_comparison(self, week):
-        child_info = self.data_controller.get_child_info()
-        fruit_data = self.baby_dev_controller.get_fruit_comparison(week)
-        size_data = self.baby_dev_controller.get_baby_size(week)
+        # Дані тижня зазвичай уже підготовлені у фоні після входу
+        payload = get_week_payload_cache().get(week, self.data_controller.get_child_info()["gender"])
+        self._update_fruit_comparison(week, payload.fruit_data)
+        self._update_info_cards(payload.cards)
+        self._prefetch_neighbour_images(week)
 
-        if fruit_data:
-            fruit_data.update(size_data)
-            # Завжди створюємо новий віджет для порівняння з фруктом
+    def _update_fruit_comparison(self, week, fruit_data):
+        if not fruit_data:
             if self.fruit_comparison_view:
-                self.fruit_comparison_view.deleteLater()
+                self.fruit_comparison_view.setVisible(False)
+            return
 
+        if self.fruit_comparison_view:
+            self.fruit_comparison_view.update_fruit_data(week, fruit_data)
+        else:
             self.fruit_comparison_view = FruitComparisonView(week, fruit_data)
             self.inner_layout.insertWidget(1, self.fruit_comparison_view)
-            # Робимо видимим
-            self.fruit_comparison_view.setVisible(True)
-
-    def _create_info_cards(self, week):
-        child_info = self.data_controller.get_child_info()
-
-        cards_data = [
-            {
-                "title": "Зростання вашої дитини",
-                "content": self.baby_dev_controller.get_baby_development_info(week, child_info["gender"])
-            },
-            {
-                "title": "Все про вас",
-                "content": self.baby_dev_controller.get_mother_changes_info(week)
-            },
-            {
-                "title": "Поради щодо харчування",
-                "content": self.baby_dev_controller.get_nutrition_tips(week)
-            },
-            {
-                "title": "Поради для вашого терміну",
-                "content": "На цьому тижні важливо слідкувати за своїм здоров'ям та відвідувати лікаря за розкладом."
-            }
-        ]
-
-        for card_data in cards_data:
-            card = InfoCard(card_data["title"], card_data["content"])
-            self.cards_layout.addWidget(card)
+        self.fruit_comparison_view.setVisible(True)
+
+    def _prefetch_neighbour_images(self, week):
+        # Сусідні тижні — найімовірніші наступні переходи стрілками
+        if week not in self.available_weeks:
+            return
+        index = self.available_weeks.index(week)
+        neighbours = [self.available_weeks[i] for i in (index + 1, index - 1) if 0 <= i < len(self.available_weeks)]
+        get_week_image_cache().prefetch(neighbours, dpr=self.devicePixelRatioF())
+
+    def _update_info_cards(self, cards):
+        for i, (title, content) in enumerate(cards):
+            if i < len(self.info_cards):
+                self.info_cards[i].update_card_data(title, content)
+            else:
+                card = InfoCard(title, content)
+                self.cards_layout.addWidget(card)
+                self.info_cards.append(card)
 
     def week_changed(self, week):
         if week != self.current_week: